@@ -276,21 +276,19 @@ class FinalCompleteIntegration:
             bhcs_state = self.mock_engine.get_state()
             
             # Apply intelligent optimizations
+            influences = []
             for zone in bhcs_state['zones']:
                 if zone['activity'] > 0.7:
                     # Apply calming effect
-                    self.mock_engine.apply_influence({
-                        'zone_id': zone['id'],
-                        'influence': -0.1
-                    })
-                    self.metrics['biocore_effects_applied'] += 1
+                    influences.append({'zone_id': zone['id'], 'influence': -0.1})
                 elif zone['activity'] < 0.3:
                     # Apply activating effect
-                    self.mock_engine.apply_influence({
-                        'zone_id': zone['id'],
-                        'influence': 0.1
-                    })
-                    self.metrics['biocore_effects_applied'] += 1
+                    influences.append({'zone_id': zone['id'], 'influence': 0.1})
+            
+            # Send the whole sweep to the engine in one call
+            if influences:
+                self.mock_engine.apply_influences(influences)
+                self.metrics['biocore_effects_applied'] += len(influences)
             
             print("✅ System Optimization Complete")
             
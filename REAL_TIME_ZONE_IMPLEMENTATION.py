@@ -6,6 +6,7 @@ Connect BHCS to actual real-world zones and data sources
 
 import asyncio
 import json
+import os
 import time
 import threading
 import requests
@@ -15,6 +16,13 @@ from pathlib import Path
 import sys
 from typing import Dict, List, Optional, Any
 
+# orjson serializes the dashboard snapshot much faster; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add paths for imports
 sys.path.append(str(Path(__file__).parent))
 sys.path.append(str(Path(__file__).parent / "lunabeyond-ai" / "src"))
@@ -482,9 +490,7 @@ class RealTimeZoneConnector:
                 dashboard_data["total_alerts"] = total_alerts
                 
                 # Save to file for dashboard
-                dashboard_path = Path(__file__).parent / "real_time_dashboard_data.json"
-                with open(dashboard_path, 'w') as f:
-                    json.dump(dashboard_data, f, indent=2)
+                self._write_dashboard_file(dashboard_data)
                 
                 await asyncio.sleep(10)  # Update every 10 seconds
                 
@@ -492,6 +498,19 @@ class RealTimeZoneConnector:
                 print(f"⚠️ Dashboard update error: {e}")
                 await asyncio.sleep(30)
     
+    def _write_dashboard_file(self, dashboard_data: Dict[str, Any]):
+        """Serialize the snapshot once and swap it in atomically so readers never see a partial file"""
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(dashboard_data, indent=2).encode()
+        
+        dashboard_path = Path(__file__).parent / "real_time_dashboard_data.json"
+        tmp_path = dashboard_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, dashboard_path)
+    
     def get_zone_status(self, zone_key: str) -> Dict[str, Any]:
         """Get current status of a specific zone"""
         if zone_key not in self.zone_data:
@@ -8,6 +8,7 @@ import subprocess
 import time
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import threading
 from pathlib import Path
 
@@ -16,6 +17,12 @@ class BHCSSystem:
         self.rust_process = None
         self.dashboard_process = None
         self.base_url = "http://localhost:3030"
+        # Keep-alive session reused for every call to the Rust engine
+        self.http = requests.Session()
+        self.http.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
         self.running = False
         
     def start_rust_engine(self):
@@ -53,7 +60,7 @@ class BHCSSystem:
         
         # Test health endpoint
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = self.http.get(f"{self.base_url}/health", timeout=5)
             if response.status_code == 200:
                 print("✅ Health endpoint working")
             else:
@@ -63,7 +70,7 @@ class BHCSSystem:
         
         # Test state endpoint
         try:
-            response = requests.get(f"{self.base_url}/state", timeout=5)
+            response = self.http.get(f"{self.base_url}/state", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 zones = data.get('zones', [])
@@ -112,7 +119,7 @@ class BHCSSystem:
                 "zone_id": 2,
                 "influence": -0.3
             }
-            response = requests.post(
+            response = self.http.post(
                 f"{self.base_url}/influence",
                 json=influence_data,
                 timeout=5
@@ -159,7 +166,7 @@ class BHCSSystem:
                 time.sleep(10)
                 # Periodically check system health
                 try:
-                    response = requests.get(f"{self.base_url}/health", timeout=2)
+                    response = self.http.get(f"{self.base_url}/health", timeout=2)
                     if response.status_code == 200:
                         print(f"💓 System heartbeat: OK")
                 except:
@@ -6,6 +6,7 @@ Web dashboard for visualizing AI insights and system performance
 
 import asyncio
 import json
+import random
 import time
 from datetime import datetime
 from typing import Dict, List
@@ -74,7 +75,6 @@ class AIDashboard:
                 
                 # Random fluctuations
                 if self.update_counter % 7 == 0:
-                    import random
                     zone_id = random.randint(0, 4)
                     influence = (random.random() - 0.5) * 0.2
                     self.bhcs.apply_influence(zone_id, influence)
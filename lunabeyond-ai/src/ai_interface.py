@@ -6,10 +6,11 @@ Connects AI intelligence with the homeostatic regulation system
 
 import asyncio
 import json
+import logging
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import asdict
-import requests
+import aiohttp
 from pathlib import Path
 import sys
 
@@ -18,6 +19,10 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from ai_core import LunaBeyondAI, SystemInsight, ZonePattern
 
+# Analysis output goes through logging; main() attaches a stdout handler
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 class LunaBeyondInterface:
     """Interface between LunaBeyond AI and BHCS system"""
     
@@ -27,14 +32,53 @@ class LunaBeyondInterface:
         self.running = False
         self.last_analysis = None
         self.ai_recommendations = []
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Short-lived /state cache so back-to-back reads in one tick share a request
+        self.state_cache_ttl = 0.25
+        self._state_cache: Optional[Tuple[float, Dict]] = None
+        
+        # Seconds to let BHCS regulate after an influence (the engines step about once a second)
+        self.regulation_interval = 1.0
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session for all BHCS API calls (created on first use)"""
+        if self._session is None or self._session.closed:
+            # One pooled connector: keep-alive sockets are reused across polls and influence bursts.
+            # BHCS is a single local host and the widest burst is one request per zone
+            # (the per-zone influence fallback) alongside a /state poll
+            connector = aiohttp.TCPConnector(limit=8, limit_per_host=8,
+                                             keepalive_timeout=30, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=3))
+        return self._session
+    
+    async def close(self):
+        """Close the BHCS API session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def warm_up(self):
+        """Pay one-time startup costs before the timed analysis loop begins"""
+        # Open the pooled connection to BHCS so the first /state poll skips the TCP handshake
+        try:
+            session = await self.get_session()
+            async with session.get(f"{self.bhcs_api_url}/health") as response:
+                await response.read()
+        except Exception as e:
+            logger.warning("⚠️ BHCS warm-up skipped: %s", e)
+        
+        # NumPy's first-call setup shouldn't be charged to the first pulse
+        self.ai.warm_up()
         
     async def start_ai_monitoring(self):
         """Start AI monitoring and analysis"""
-        print("🧠 LunaBeyond AI Starting...")
-        print("🔗 Connecting to BHCS System...")
-        print("📊 Beginning intelligent analysis...")
+        logger.info("🧠 LunaBeyond AI Starting...")
+        logger.info("🔗 Connecting to BHCS System...")
+        logger.info("📊 Beginning intelligent analysis...")
         
         self.running = True
+        await self.warm_up()
         
         while self.running:
             try:
@@ -60,19 +104,73 @@ class LunaBeyondInterface:
                 await asyncio.sleep(2)  # Analyze every 2 seconds
                 
             except Exception as e:
-                print(f"❌ AI Analysis Error: {e}")
+                logger.error("❌ AI Analysis Error: %s", e)
                 await asyncio.sleep(5)
     
-    async def get_bhcs_state(self) -> Optional[Dict]:
-        """Get current BHCS system state"""
+    async def get_bhcs_state(self, fresh: bool = False) -> Optional[Dict]:
+        """Get current BHCS system state (served from a short TTL cache unless ``fresh``)"""
+        if not fresh and self._state_cache is not None:
+            fetched_at, state = self._state_cache
+            if time.monotonic() - fetched_at < self.state_cache_ttl:
+                return state
+        
         try:
-            response = requests.get(f"{self.bhcs_api_url}/state", timeout=3)
-            if response.status_code == 200:
-                return response.json()
+            session = await self.get_session()
+            async with session.get(f"{self.bhcs_api_url}/state") as response:
+                if response.status == 200:
+                    state = await response.json()
+                    self._state_cache = (time.monotonic(), state)
+                    return state
         except Exception as e:
-            print(f"⚠️ BHCS API Connection Issue: {e}")
+            logger.warning("⚠️ BHCS API Connection Issue: %s", e)
         return None
     
+    async def send_influence(self, zone_id: int, influence: float) -> bool:
+        """Apply an influence to a BHCS zone"""
+        session = await self.get_session()
+        async with session.post(
+            f"{self.bhcs_api_url}/influence",
+            json={"zone_id": zone_id, "influence": influence}
+        ) as response:
+            # Zone activity changed, so any cached /state is stale
+            self._state_cache = None
+            return response.status == 200
+    
+    async def send_influences(self, influences: List[Tuple[int, float]]) -> bool:
+        """Apply several zone influences in one request, falling back to one request per zone"""
+        if not influences:
+            return True
+        
+        session = await self.get_session()
+        async with session.post(
+            f"{self.bhcs_api_url}/influence/batch",
+            json={"influences": [
+                {"zone_id": zone_id, "influence": influence}
+                for zone_id, influence in influences
+            ]}
+        ) as response:
+            self._state_cache = None
+            if response.status != 404:
+                return response.status == 200
+        
+        # Older engines without the batch route
+        results = await asyncio.gather(*[
+            self.send_influence(zone_id, influence)
+            for zone_id, influence in influences
+        ])
+        return all(results)
+    
+    async def wait_for_regulation(self) -> Optional[Dict]:
+        """
+        State after one BHCS regulation interval, read fresh past the state cache.
+        
+        The engine's /state response has no tick or step counter, so there is
+        nothing to tell a regulated reading from a re-read of the same one; this
+        waits one interval and reads once. Returns None if BHCS could not be reached.
+        """
+        await asyncio.sleep(self.regulation_interval)
+        return await self.get_bhcs_state(fresh=True)
+    
     def calculate_system_health(self, zones: List[Dict]) -> float:
         """Calculate system health percentage"""
         if not zones:
@@ -86,9 +184,12 @@ class LunaBeyondInterface:
         recommendations = insights.recommended_actions
         
         for recommendation in recommendations:
-            print(f"\n🧠 AI Recommendation: {recommendation.get('type', 'unknown')}")
-            print(f"   Priority: {recommendation.get('priority', 'low')}")
-            print(f"   Reason: {recommendation.get('reason', 'N/A')}")
+            logger.info(
+                "\n🧠 AI Recommendation: %s\n   Priority: %s\n   Reason: %s",
+                recommendation.get('type', 'unknown'),
+                recommendation.get('priority', 'low'),
+                recommendation.get('reason', 'N/A')
+            )
             
             # Execute high-priority recommendations automatically
             if recommendation.get('priority') == 'high' and recommendation.get('urgency') == 'immediate':
@@ -112,10 +213,10 @@ class LunaBeyondInterface:
                 # Apply system optimization
                 await self.apply_system_optimization()
             
-            print(f"✅ Executed AI recommendation: {recommendation['type']}")
+            logger.info("✅ Executed AI recommendation: %s", recommendation['type'])
             
         except Exception as e:
-            print(f"❌ Failed to execute recommendation: {e}")
+            logger.error("❌ Failed to execute recommendation: %s", e)
     
     async def apply_biocore_intervention(self, zone_id: int, plant: str, drug: str, synergy: float):
         """Apply BioCore intervention based on AI recommendation"""
@@ -127,24 +228,10 @@ class LunaBeyondInterface:
             
             before_state = system_state['zones'][zone_id]
             
-            # Apply influence to zone
-            influence_data = {
-                "zone_id": zone_id,
-                "influence": -0.3  # Calming influence
-            }
-            
-            response = requests.post(
-                f"{self.bhcs_api_url}/influence",
-                json=influence_data,
-                timeout=3
-            )
-            
-            if response.status_code == 200:
-                # Wait a moment for effect
-                await asyncio.sleep(1)
-                
-                # Get after state
-                after_state_response = await self.get_bhcs_state()
+            # Apply calming influence to zone
+            if await self.send_influence(zone_id, -0.3):
+                # Let BHCS regulate once before measuring the effect
+                after_state_response = await self.wait_for_regulation()
                 if after_state_response:
                     after_state = after_state_response['zones'][zone_id]
                     
@@ -154,76 +241,77 @@ class LunaBeyondInterface:
                         before_state, after_state
                     )
                     
-                    print(f"🌿 Applied BioCore: {plant} + {drug} to Zone {zone_id}")
-                    print(f"   Before: {before_state['activity']:.3f} ({before_state['state']})")
-                    print(f"   After: {after_state['activity']:.3f} ({after_state['state']})")
+                    logger.info(
+                        "🌿 Applied BioCore: %s + %s to Zone %d\n   Before: %.3f (%s)\n   After: %.3f (%s)",
+                        plant, drug, zone_id,
+                        before_state['activity'], before_state['state'],
+                        after_state['activity'], after_state['state']
+                    )
         
         except Exception as e:
-            print(f"❌ BioCore intervention failed: {e}")
+            logger.error("❌ BioCore intervention failed: %s", e)
     
     async def apply_system_optimization(self):
         """Apply system-wide optimization"""
         try:
             # This would call the BHCS system optimization endpoint
-            print("🧠 Applying AI-driven system optimization...")
+            logger.info("🧠 Applying AI-driven system optimization...")
             
             # For now, apply calming influence to all stressed zones
             system_state = await self.get_bhcs_state()
             if not system_state:
                 return
             
-            for i, zone in enumerate(system_state['zones']):
-                if zone['activity'] > 0.6:
-                    influence_data = {
-                        "zone_id": i,
-                        "influence": -0.2
-                    }
-                    
-                    requests.post(
-                        f"{self.bhcs_api_url}/influence",
-                        json=influence_data,
-                        timeout=3
-                    )
+            # Influence every stressed zone in a single batch
+            await self.send_influences([
+                (i, -0.2)
+                for i, zone in enumerate(system_state['zones'])
+                if zone['activity'] > 0.6
+            ])
             
-            print("✅ System optimization applied")
+            logger.info("✅ System optimization applied")
             
         except Exception as e:
-            print(f"❌ System optimization failed: {e}")
+            logger.error("❌ System optimization failed: %s", e)
     
     def display_ai_insights(self, insights: SystemInsight):
         """Display AI insights in a user-friendly format"""
-        print(f"\n🧠 LunaBeyond AI Insights - {time.strftime('%H:%M:%S')}")
-        print("=" * 60)
+        # Skip building the report entirely when nobody is listening at INFO
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        lines = [f"\n🧠 LunaBeyond AI Insights - {time.strftime('%H:%M:%S')}", "=" * 60]
         
         # System health prediction
         health_pct = insights.system_health_prediction * 100
-        print(f"📊 Predicted System Health: {health_pct:.1f}%")
+        lines.append(f"📊 Predicted System Health: {health_pct:.1f}%")
         
         # Risk zones
         if insights.risk_zones:
-            print(f"⚠️  Risk Zones: {', '.join(map(str, insights.risk_zones))}")
+            lines.append(f"⚠️  Risk Zones: {', '.join(map(str, insights.risk_zones))}")
         else:
-            print("✅ No immediate risk zones detected")
+            lines.append("✅ No immediate risk zones detected")
         
         # Top recommendations
         if insights.recommended_actions:
-            print(f"\n🎯 Top {len(insights.recommended_actions)} Recommendations:")
+            lines.append(f"\n🎯 Top {len(insights.recommended_actions)} Recommendations:")
             for i, rec in enumerate(insights.recommended_actions[:3], 1):
                 priority_emoji = "🔴" if rec.get('priority') == 'high' else "🟡"
-                print(f"   {i}. {priority_emoji} {rec.get('type', 'Unknown')}")
-                print(f"      {rec.get('reason', 'No reason provided')}")
+                lines.append(f"   {i}. {priority_emoji} {rec.get('type', 'Unknown')}")
+                lines.append(f"      {rec.get('reason', 'No reason provided')}")
         
         # Optimization opportunities
         if insights.optimization_opportunities:
-            print(f"\n💡 Optimization Opportunities:")
+            lines.append(f"\n💡 Optimization Opportunities:")
             for opp in insights.optimization_opportunities[:3]:
-                print(f"   • {opp}")
+                lines.append(f"   • {opp}")
         
         # Learning progress
         learning_pct = insights.learning_progress * 100
-        print(f"\n📚 AI Learning Progress: {learning_pct:.1f}%")
+        lines.append(f"\n📚 AI Learning Progress: {learning_pct:.1f}%")
         
-        print("=" * 60)
+        lines.append("=" * 60)
+        logger.info("\n".join(lines))
     
     def get_ai_dashboard_data(self) -> Dict:
         """Get data for AI dashboard display"""
@@ -240,7 +328,7 @@ class LunaBeyondInterface:
     
     async def start_ai_dashboard(self):
         """Start AI dashboard for monitoring"""
-        print("🌐 Starting LunaBeyond AI Dashboard...")
+        logger.info("🌐 Starting LunaBeyond AI Dashboard...")
         
         # This would start a web dashboard for AI monitoring
         # For now, we'll print periodic status updates
@@ -254,21 +342,25 @@ class LunaBeyondInterface:
             try:
                 dashboard_data = self.get_ai_dashboard_data()
                 
-                print(f"\n🌐 AI Dashboard Status:")
-                print(f"   Learning: {'✅ Enabled' if dashboard_data['learning_enabled'] else '❌ Disabled'}")
-                print(f"   Accuracy: {dashboard_data['ai_status']['prediction_accuracy']:.1%}")
-                print(f"   Interventions: {dashboard_data['ai_status']['successful_interventions']}/{dashboard_data['ai_status']['interventions_recommended']}")
-                print(f"   Data Points: {dashboard_data['ai_status']['data_points_collected']}")
+                ai_status = dashboard_data['ai_status']
+                logger.info(
+                    "\n🌐 AI Dashboard Status:\n   Learning: %s\n   Accuracy: %.1f%%\n   Interventions: %d/%d\n   Data Points: %d",
+                    '✅ Enabled' if dashboard_data['learning_enabled'] else '❌ Disabled',
+                    ai_status['prediction_accuracy'] * 100,
+                    ai_status['successful_interventions'],
+                    ai_status['interventions_recommended'],
+                    ai_status['data_points_collected']
+                )
                 
                 await asyncio.sleep(10)  # Update dashboard every 10 seconds
                 
             except Exception as e:
-                print(f"❌ Dashboard Error: {e}")
+                logger.error("❌ Dashboard Error: %s", e)
                 await asyncio.sleep(5)
     
     def stop_ai_monitoring(self):
         """Stop AI monitoring"""
-        print("🛑 Stopping LunaBeyond AI...")
+        logger.info("🛑 Stopping LunaBeyond AI...")
         self.running = False
     
     def get_zone_analysis(self, zone_id: int) -> Dict:
@@ -312,6 +404,8 @@ class LunaBeyondInterface:
 # Main execution
 async def main():
     """Main LunaBeyond AI execution"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("🌙 LunaBeyond AI - Intelligent BHCS Backend")
     print("🧠 Advanced AI for Homeostatic System Optimization")
     print("=" * 60)
@@ -339,6 +433,9 @@ async def main():
         print("\n🛑 Shutting down LunaBeyond AI...")
         ai_interface.stop_ai_monitoring()
         print("✅ AI monitoring stopped")
+    
+    finally:
+        await ai_interface.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
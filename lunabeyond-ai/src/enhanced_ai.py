@@ -16,6 +16,10 @@ import pickle
 import os
 from pathlib import Path
 
+# Daily-cycle offsets for the 24 hour health trajectory (constant, so built once)
+_TRAJECTORY_HOURS = 24
+_DAILY_CYCLE = 0.1 * np.sin(2 * np.pi * np.arange(_TRAJECTORY_HOURS) / 12)
+
 @dataclass
 class AdvancedPattern:
     """Advanced zone pattern with deep learning insights"""
@@ -203,20 +207,13 @@ class EnhancedLunaBeyondAI:
                 if self.prediction_network['output_activation'] == 'sigmoid':
                     x = 1 / (1 + np.exp(-x))
         
-        # Generate trajectory over time
-        base_prediction = float(x[0, 0])
-        trajectory = []
+        # Generate 24 hour trajectory in one array pass
+        noise = np.random.normal(0, 0.02, size=_TRAJECTORY_HOURS)  # Prediction uncertainty
         
-        for t in range(24):  # 24 hour prediction
-            # Add time-based variation
-            time_factor = 0.1 * np.sin(2 * np.pi * t / 12)  # Daily cycle
-            noise = np.random.normal(0, 0.02)  # Prediction uncertainty
-            
-            predicted_health = base_prediction + time_factor + noise
-            predicted_health = max(0.0, min(1.0, predicted_health))
-            trajectory.append(predicted_health)
+        trajectory = np.clip(x[0, 0] + _DAILY_CYCLE + noise, 0.0, 1.0)
         
-        return trajectory
+        # Single conversion back to Python floats
+        return trajectory.tolist()
     
     def _detect_anomalies(self, features: np.ndarray) -> List[float]:
         """Detect anomalies using pattern recognition"""
@@ -20,6 +20,54 @@ sys.path.append(str(Path(__file__).parent))
 from enhanced_ai import EnhancedLunaBeyondAI
 from test_system import BHCS, BioCore
 
+HELP_MESSAGE = """
+🌙 LunaBeyond AI Commands:
+
+💬 CONVERSATION:
+  Just type and chat with me about the BHCS system!
+
+📊 SYSTEM COMMANDS:
+  /status     - Current system health and metrics
+  /zones      - Detailed zone information
+  /ai         - My current AI status and capabilities
+  /predict    - System predictions and forecasts
+  /recommend  - AI recommendations for optimization
+  /optimize   - Apply AI optimization to system
+
+🧠 AI COMMANDS:
+  /learn      - Trigger active learning session
+  /evolve     - Evolve AI to next generation
+  /memory     - Show memory and learning status
+  /personality- Show my personality traits
+
+🔧 SYSTEM CONTROL:
+  /reset      - Reset system to initial state
+
+💡 TIP: I learn from every conversation! The more we interact, the smarter I become.
+        """
+
+# Keywords that pick process_conversation's reply, tested in this order
+CONVERSATION_ROUTES = (
+    ('status', ('health', 'status', 'how', 'doing')),
+    ('zones', ('zone', 'zones', 'area', 'region')),
+    ('ai', ('ai', 'you', 'your', 'intelligence', 'learn')),
+    ('predict', ('predict', 'future', 'forecast', 'will')),
+    ('recommend', ('recommend', 'suggest', 'should', 'advice')),
+    ('learning', ('learn', 'evolve', 'improve', 'grow')),
+    ('optimize', ('optimize', 'improve', 'fix', 'better')),
+)
+
+def route_conversation(user_input: str) -> str:
+    """Which reply process_conversation gives a message ('chat' for general conversation)"""
+    user_input_lower = user_input.lower()
+    for route, keywords in CONVERSATION_ROUTES:
+        if any(word in user_input_lower for word in keywords):
+            return route
+    return 'chat'
+
+# Exchanges kept in memory; learning only ever looks at the most recent 20
+MAX_CONVERSATION_HISTORY = 200
+
 class LunaConversation:
     """Conversational AI interface for LunaBeyond"""
     
@@ -30,6 +78,7 @@ class LunaConversation:
         
         # Conversation state
         self.conversation_history = []
+        self.conversation_count = 0  # every exchange, including ones aged out of the history
         self.personality = {
             'name': 'LunaBeyond',
             'mood': 'curious',
@@ -76,7 +125,7 @@ class LunaConversation:
                 await self.learn_from_interaction(user_input, response)
                 
                 # Update AI periodically
-                if len(self.conversation_history) % 10 == 0:
+                if self.conversation_count % 10 == 0:
                     await self.update_ai_from_conversation()
                 
             except KeyboardInterrupt:
@@ -119,31 +168,7 @@ class LunaConversation:
     
     def get_help_message(self) -> str:
         """Get help message"""
-        return """
-🌙 LunaBeyond AI Commands:
-
-💬 CONVERSATION:
-  Just type and chat with me about the BHCS system!
-
-📊 SYSTEM COMMANDS:
-  /status     - Current system health and metrics
-  /zones      - Detailed zone information
-  /ai         - My current AI status and capabilities
-  /predict    - System predictions and forecasts
-  /recommend  - AI recommendations for optimization
-  /optimize   - Apply AI optimization to system
-
-🧠 AI COMMANDS:
-  /learn      - Trigger active learning session
-  /evolve     - Evolve AI to next generation
-  /memory     - Show memory and learning status
-  /personality- Show my personality traits
-
-🔧 SYSTEM CONTROL:
-  /reset      - Reset system to initial state
-
-💡 TIP: I learn from every conversation! The more we interact, the smarter I become.
-        """
+        return HELP_MESSAGE
     
     async def get_system_status(self) -> str:
         """Get current system status"""
@@ -203,7 +228,7 @@ class LunaConversation:
 🌙 PERSONALITY:
    Mood: {self.personality['mood']}
    Knowledge Level: {self.personality['knowledge_level']}
-   Conversations: {len(self.conversation_history)}
+   Conversations: {self.conversation_count}
    Learning: {'✅ Active' if self.personality['learning_active'] else '❌ Paused'}
 
 📚 CAPABILITIES:
@@ -343,7 +368,7 @@ class LunaConversation:
         """Get memory and learning status"""
         return f"""
 🧠 MEMORY STATUS:
-   Conversation History: {len(self.conversation_history)} exchanges
+   Conversation History: {self.conversation_count} exchanges
    Conversation Patterns: {len(self.conversation_patterns)} learned
    User Preferences: {len(self.user_preferences)} tracked
    System Insights: {len(self.system_insights)} recorded
@@ -359,37 +384,22 @@ class LunaConversation:
     
     async def process_conversation(self, user_input: str) -> str:
         """Process conversational input"""
-        user_input_lower = user_input.lower()
+        route = route_conversation(user_input)
         
-        # System health questions
-        if any(word in user_input_lower for word in ['health', 'status', 'how', 'doing']):
+        if route == 'status':
             return await self.get_system_status()
-        
-        # Zone questions
-        elif any(word in user_input_lower for word in ['zone', 'zones', 'area', 'region']):
+        elif route == 'zones':
             return await self.get_zones_status()
-        
-        # AI questions
-        elif any(word in user_input_lower for word in ['ai', 'you', 'your', 'intelligence', 'learn']):
+        elif route == 'ai':
             return await self.get_ai_status()
-        
-        # Prediction questions
-        elif any(word in user_input_lower for word in ['predict', 'future', 'forecast', 'will']):
+        elif route == 'predict':
             return await self.get_predictions()
-        
-        # Recommendation questions
-        elif any(word in user_input_lower for word in ['recommend', 'suggest', 'should', 'advice']):
+        elif route == 'recommend':
             return await self.get_recommendations()
-        
-        # Learning questions
-        elif any(word in user_input_lower for word in ['learn', 'evolve', 'improve', 'grow']):
+        elif route == 'learning':
             return f"🧠 I'm constantly learning! I'm currently at generation {self.ai.generation} with {self.ai.performance_metrics['accuracy']:.1%} accuracy. Type '/evolve' to accelerate my growth!"
-        
-        # Optimization questions
-        elif any(word in user_input_lower for word in ['optimize', 'improve', 'fix', 'better']):
+        elif route == 'optimize':
             return await self.optimize_system()
-        
-        # General conversation
         else:
             return self.generate_conversational_response(user_input)
     
@@ -430,6 +440,10 @@ class LunaConversation:
                 'zones': len(self.bhcs.zones)
             }
         })
+        self.conversation_count += 1
+        # Bounded transcript: a long-running server would otherwise grow it forever
+        if len(self.conversation_history) > MAX_CONVERSATION_HISTORY:
+            del self.conversation_history[:-MAX_CONVERSATION_HISTORY]
         
         # Update personality based on interaction
         if any(word in user_input.lower() for word in ['learn', 'smart', 'intelligent']):
@@ -6,6 +6,7 @@ Optimized response generation with cognitive processing and learning integration
 
 import asyncio
 import json
+import random
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -196,7 +197,6 @@ class LunaFastResponse:
             emotional_tone = input_analysis['emotional_tone']
             
             # Simple selection logic - can be enhanced
-            import random
             return random.choice(stage_templates)
         
         # Fallback template
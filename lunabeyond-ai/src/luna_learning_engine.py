@@ -10,11 +10,57 @@ import time
 import random
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
 from dataclasses import dataclass
 import requests
 from bs4 import BeautifulSoup
 import re
+from collections import deque
+from itertools import islice
+
+def _keyword_regex(keywords) -> re.Pattern:
+    """One compiled alternation that finds any keyword as a substring"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+@lru_cache(maxsize=512)
+def _normalize(text: str) -> Tuple[str, frozenset]:
+    """Lowercased text and its word set, computed once per distinct string"""
+    lowered = text.lower()
+    return lowered, frozenset(lowered.split())
+
+# Keyword tables for text analysis, built once at import
+INPUT_PATTERNS = {
+    'greeting_patterns': ('hello', 'hi', 'hey', 'greetings'),
+    'question_patterns': ('what', 'how', 'why', 'when', 'where'),
+    'emotional_patterns': ('love', 'amazing', 'beautiful', 'thank', 'awesome'),
+    'technical_patterns': ('status', 'predict', 'analyze', 'optimize'),
+    'learning_patterns': ('learn', 'evolve', 'improve', 'teach')
+}
+
+POSITIVE_WORDS = frozenset(['love', 'amazing', 'beautiful', 'excellent', 'perfect', 'awesome', 'thank'])
+NEGATIVE_WORDS = frozenset(['bad', 'terrible', 'awful', 'hate', 'worst', 'broken'])
+
+INTENT_PATTERNS = {
+    intent: _keyword_regex(keywords) for intent, keywords in {
+        'greeting': ('hello', 'hi', 'hey', 'greetings'),
+        'question': ('what', 'how', 'why', 'when', 'where', '?'),
+        'command': ('status', 'predict', 'analyze', 'optimize'),
+        'emotional': ('love', 'amazing', 'beautiful', 'thank'),
+        'learning': ('learn', 'teach', 'evolve', 'improve')
+    }.items()
+}
+
+SYSTEM_ENTITIES = ('luna', 'ai', 'system', 'zones', 'biocore', 'health')
+
+TONE_PATTERNS = {
+    tone: _keyword_regex(words) for tone, words in {
+        'excited': ('excited', 'amazing', 'awesome', 'fantastic'),
+        'curious': ('curious', 'wonder', 'interesting', 'fascinating'),
+        'confident': ('confident', 'sure', 'certain', 'positive'),
+        'helpful': ('help', 'assist', 'support', 'guide')
+    }.items()
+}
 
 @dataclass
 class LearningMemory:
@@ -31,7 +77,8 @@ class LunaLearningEngine:
     """Advanced learning engine with online data integration"""
     
     def __init__(self):
-        self.conversation_memory = []
+        # Bounded ring buffer shared by every front end; oldest entries fall off on append
+        self.conversation_memory = deque(maxlen=100)
         self.learning_patterns = {}
         self.neural_weights = np.random.rand(50, 32)  # Neural network weights
         self.learning_rate = 0.01
@@ -50,6 +97,11 @@ class LunaLearningEngine:
         self.learning_velocity = 0.0
         self.knowledge_expansion_rate = 0.0
         
+    def recent_memories(self, count: int) -> List[Dict]:
+        """Return the last ``count`` memories"""
+        memory = self.conversation_memory
+        return list(islice(memory, max(len(memory) - count, 0), None))
+    
     async def cognitive_processing(self, user_input: str, context: Dict) -> Dict:
         """
         🧠 Advanced cognitive processing before response generation
@@ -94,7 +146,7 @@ class LunaLearningEngine:
         return {
             'system_health': context.get('health', 0.5),
             'active_zones': context.get('zones', []),
-            'recent_interactions': self.conversation_memory[-5:],
+            'recent_interactions': self.recent_memories(5),
             'time_context': datetime.now().isoformat(),
             'environmental_factors': self.analyze_environmental_factors(context)
         }
@@ -102,10 +154,10 @@ class LunaLearningEngine:
     async def retrieve_relevant_memories(self, user_input: str) -> List[Dict]:
         """Retrieve relevant memories for context"""
         relevant_memories = []
-        input_keywords = set(user_input.lower().split())
+        _, input_keywords = _normalize(user_input)
         
-        for memory in self.conversation_memory[-20:]:  # Last 20 memories
-            memory_keywords = set(memory['user_input'].lower().split())
+        for memory in self.recent_memories(20):  # Last 20 memories
+            _, memory_keywords = _normalize(memory['user_input'])
             similarity = len(input_keywords & memory_keywords) / len(input_keywords | memory_keywords)
             
             if similarity > 0.2:  # 20% similarity threshold
@@ -119,23 +171,17 @@ class LunaLearningEngine:
     
     async def match_patterns(self, user_input: str) -> Dict:
         """Match input against learned patterns"""
-        patterns = {
-            'greeting_patterns': ['hello', 'hi', 'hey', 'greetings'],
-            'question_patterns': ['what', 'how', 'why', 'when', 'where'],
-            'emotional_patterns': ['love', 'amazing', 'beautiful', 'thank', 'awesome'],
-            'technical_patterns': ['status', 'predict', 'analyze', 'optimize'],
-            'learning_patterns': ['learn', 'evolve', 'improve', 'teach']
-        }
+        input_lower, _ = _normalize(user_input)
         
         matched_patterns = {}
-        for pattern_type, pattern_list in patterns.items():
-            matches = [p for p in pattern_list if p in user_input.lower()]
+        for pattern_type, pattern_list in INPUT_PATTERNS.items():
+            matches = [p for p in pattern_list if p in input_lower]
             if matches:
                 matched_patterns[pattern_type] = matches
         
         return {
             'matched_patterns': matched_patterns,
-            'pattern_confidence': len(matched_patterns) / len(patterns),
+            'pattern_confidence': len(matched_patterns) / len(INPUT_PATTERNS),
             'novelty_score': self.calculate_novelty(user_input)
         }
     
@@ -191,7 +237,7 @@ class LunaLearningEngine:
         }
         
         # Determine relevant domain
-        query_lower = query.lower()
+        query_lower, _ = _normalize(query)
         for domain, knowledge in knowledge_domains.items():
             if any(keyword in query_lower for keyword in domain.split()):
                 return {
@@ -205,12 +251,9 @@ class LunaLearningEngine:
     
     def analyze_sentiment(self, text: str) -> str:
         """Analyze sentiment of text"""
-        positive_words = ['love', 'amazing', 'beautiful', 'excellent', 'perfect', 'awesome', 'thank']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'worst', 'broken']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        text_lower, _ = _normalize(text)
+        positive_count = sum(1 for word in POSITIVE_WORDS if word in text_lower)
+        negative_count = sum(1 for word in NEGATIVE_WORDS if word in text_lower)
         
         if positive_count > negative_count:
             return 'positive'
@@ -221,17 +264,9 @@ class LunaLearningEngine:
     
     def classify_intent(self, text: str) -> str:
         """Classify user intent"""
-        intents = {
-            'greeting': ['hello', 'hi', 'hey', 'greetings'],
-            'question': ['what', 'how', 'why', 'when', 'where', '?'],
-            'command': ['status', 'predict', 'analyze', 'optimize'],
-            'emotional': ['love', 'amazing', 'beautiful', 'thank'],
-            'learning': ['learn', 'teach', 'evolve', 'improve']
-        }
-        
-        text_lower = text.lower()
-        for intent, keywords in intents.items():
-            if any(keyword in text_lower for keyword in keywords):
+        text_lower, _ = _normalize(text)
+        for intent, pattern in INTENT_PATTERNS.items():
+            if pattern.search(text_lower):
                 return intent
         
         return 'conversation'
@@ -254,25 +289,18 @@ class LunaLearningEngine:
         entities = []
         
         # System entities
-        system_entities = ['luna', 'ai', 'system', 'zones', 'biocore', 'health']
-        for entity in system_entities:
-            if entity in text.lower():
+        text_lower, _ = _normalize(text)
+        for entity in SYSTEM_ENTITIES:
+            if entity in text_lower:
                 entities.append(entity)
         
         return entities
     
     def detect_emotional_tone(self, text: str) -> str:
         """Detect emotional tone"""
-        emotional_words = {
-            'excited': ['excited', 'amazing', 'awesome', 'fantastic'],
-            'curious': ['curious', 'wonder', 'interesting', 'fascinating'],
-            'confident': ['confident', 'sure', 'certain', 'positive'],
-            'helpful': ['help', 'assist', 'support', 'guide']
-        }
-        
-        text_lower = text.lower()
-        for tone, words in emotional_words.items():
-            if any(word in text_lower for word in words):
+        text_lower, _ = _normalize(text)
+        for tone, pattern in TONE_PATTERNS.items():
+            if pattern.search(text_lower):
                 return tone
         
         return 'neutral'
@@ -324,13 +352,13 @@ class LunaLearningEngine:
         
         # Compare with past inputs
         similarities = []
-        for memory in self.conversation_memory[-10:]:
-            past_input = memory['user_input'].lower()
-            current_input = user_input.lower()
+        _, current_words = _normalize(user_input)
+        for memory in self.recent_memories(10):
+            _, past_words = _normalize(memory['user_input'])
             
             # Simple similarity calculation
-            common_words = set(past_input.split()) & set(current_input.split())
-            total_words = set(past_input.split()) | set(current_input.split())
+            common_words = past_words & current_words
+            total_words = past_words | current_words
             similarity = len(common_words) / len(total_words) if total_words else 0
             similarities.append(similarity)
         
@@ -368,21 +396,23 @@ class LunaLearningEngine:
         predictions = []
         
         # Simple predictive logic
-        if 'learn' in query.lower():
+        query_lower, _ = _normalize(query)
+        if 'learn' in query_lower:
             predictions.append("Learning velocity will increase with this interaction")
         
-        if 'system' in query.lower():
+        if 'system' in query_lower:
             predictions.append("System optimization patterns detected")
         
         return predictions
     
     def determine_response_type(self, user_input: str) -> str:
         """Determine optimal response type"""
+        input_lower, _ = _normalize(user_input)
         if '?' in user_input:
             return 'analytical_response'
-        elif any(word in user_input.lower() for word in ['hello', 'hi', 'hey']):
+        elif any(word in input_lower for word in ('hello', 'hi', 'hey')):
             return 'greeting_response'
-        elif any(word in user_input.lower() for word in ['thank', 'amazing', 'beautiful']):
+        elif any(word in input_lower for word in ('thank', 'amazing', 'beautiful')):
             return 'emotional_response'
         else:
             return 'conversational_response'
@@ -395,7 +425,7 @@ class LunaLearningEngine:
             return 'excited'
         elif '?' in user_input:
             return 'curious'
-        elif any(word in user_input.lower() for word in ['help', 'how', 'what']):
+        elif any(word in _normalize(user_input)[0] for word in ('help', 'how', 'what')):
             return 'helpful'
         else:
             return 'confident'
@@ -417,7 +447,7 @@ class LunaLearningEngine:
             return 0.0
         
         # Personalization based on conversation history
-        recent_interactions = self.conversation_memory[-5:]
+        recent_interactions = self.recent_memories(5)
         personalization_score = len(recent_interactions) * 0.1
         
         return min(personalization_score, 1.0)
@@ -133,7 +133,6 @@ class LunaVoiceChat:
             self.show_thinking_indicator()
             
             # Process through Luna's learning engine
-            import asyncio
             loop = asyncio.new_event_loop()
             
             # Simulate cognitive processing
@@ -267,15 +266,9 @@ I'm processing your voice with neural networks!"""
             'context': response_data
         }
         
-        if not hasattr(self.learning_engine, 'conversation_memory'):
-            self.learning_engine.conversation_memory = []
-        
+        # Bounded by the learning engine; the oldest entries fall off on append
         self.learning_engine.conversation_memory.append(memory_entry)
         
-        # Keep memory manageable
-        if len(self.learning_engine.conversation_memory) > 50:
-            self.learning_engine.conversation_memory = self.learning_engine.conversation_memory[-25:]
-        
         # Update mood based on voice interaction
         self.update_luna_mood_voice(user_input)
         
@@ -6,14 +6,148 @@ Complete voice interaction system with natural conversation
 
 import asyncio
 import json
+import logging
+import logging.handlers
+import sys
 import time
 import threading
 import queue
+import re
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from luna_conversation_manager import luna_conversation_manager
 from luna_learning_engine import luna_learning_engine
 
+logger = logging.getLogger(__name__)
+
+# Captured speech is normalized once to 16 kHz mono int16 before it moves
+# through the VAD / STT stages (and before it is uploaded for recognition)
+SPEECH_SAMPLE_RATE = 16000
+SPEECH_SAMPLE_WIDTH = 2
+SPEECH_FRAME_SIZE = 480  # 30 ms at 16 kHz
+
+# While Luna is speaking the microphone also hears her through the speakers;
+# barge-in needs the user to be this many times louder than the noise floor
+BARGE_IN_ENERGY_RATIO = 3.0
+
+VOICE_COMMANDS = (
+    'hello luna',
+    'stop listening',
+    'start listening',
+    'goodbye luna',
+    'luna sleep',
+    'luna wake up',
+    'what can i say',
+    'voice commands',
+    'help voice'
+)
+
+def _build_command_matcher(commands):
+    """
+    Compile the command phrases into a single-pass matcher.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise one precompiled regex alternation.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        alternation = '|'.join(re.escape(c) for c in sorted(commands, key=len, reverse=True))
+        pattern = re.compile(rf'\b(?:{alternation})\b')
+        
+        def match(text: str) -> Optional[Tuple[str, Tuple[int, int]]]:
+            found = pattern.search(text)
+            return (found.group(0), found.span()) if found else None
+        
+        return match
+    
+    automaton = ahocorasick.Automaton()
+    for command in commands:
+        automaton.add_word(command, command)
+    automaton.make_automaton()
+    
+    def match(text: str) -> Optional[Tuple[str, Tuple[int, int]]]:
+        for end, command in automaton.iter(text):
+            start = end - len(command) + 1
+            # Only accept whole-word hits ("hello lunar" is not a command)
+            if (start == 0 or not text[start - 1].isalnum()) and \
+                    (end + 1 == len(text) or not text[end + 1].isalnum()):
+                return command, (start, end + 1)
+        return None
+    
+    return match
+
+_match_voice_command = _build_command_matcher(VOICE_COMMANDS)
+
+def frame_signal(samples: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """Strided (n_frames, frame_length) view over a 1-D signal, no copy"""
+    if len(samples) < frame_length:
+        samples = np.pad(samples, (0, frame_length - len(samples)))
+    return np.lib.stride_tricks.sliding_window_view(samples, frame_length)[::hop_length]
+
+_FEMALE_VOICE_ID = None
+_voice_scanned = False
+
+def _pick_female_voice(engine) -> Optional[str]:
+    """Scan the installed TTS voices once per process for a female voice"""
+    global _FEMALE_VOICE_ID, _voice_scanned
+    if not _voice_scanned:
+        for voice in engine.getProperty('voices'):
+            if 'female' in voice.name.lower():
+                _FEMALE_VOICE_ID = voice.id
+                break
+        _voice_scanned = True
+    return _FEMALE_VOICE_ID
+
+def _create_recognizer(sr):
+    """
+    Build a Recognizer whose Google STT calls share one pooled
+    requests.Session, so utterances after the first skip the TCP/TLS
+    handshake. Falls back to the stock Recognizer on older
+    speech_recognition releases without the google request helpers.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from speech_recognition.recognizers import google
+    except ImportError:
+        return sr.Recognizer()
+    
+    class LunaRecognizer(sr.Recognizer):
+        def __init__(self):
+            super().__init__()
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+        
+        def recognize_google(self, audio_data, key=None, language="en-US", pfilter=0,
+                             show_all=False, with_confidence=False, endpoint=google.ENDPOINT):
+            request = google.create_request_builder(
+                endpoint=endpoint, key=key, language=language, filter_level=pfilter
+            ).build(audio_data)
+            
+            try:
+                response = self.session.post(
+                    request.full_url,
+                    data=request.data,
+                    headers=dict(request.header_items()),
+                    timeout=self.operation_timeout or 10
+                )
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                raise sr.RequestError(f"recognition request failed: {e.response.reason}")
+            except requests.RequestException as e:
+                raise sr.RequestError(f"recognition connection failed: {e}")
+            
+            return google.OutputParser(
+                show_all=show_all, with_confidence=with_confidence
+            ).parse(response.text)
+    
+    return LunaRecognizer()
+
 class LunaVoiceInterface:
     """Complete voice interface for natural Luna conversation"""
     
@@ -21,10 +155,29 @@ class LunaVoiceInterface:
         self.conversation_manager = luna_conversation_manager
         self.learning_engine = luna_learning_engine
         
-        # Voice processing queue
-        self.voice_queue = queue.Queue()
+        # Voice command channel: single producer (dialog stage), single
+        # consumer (management loop); deque append/popleft are atomic
+        self._voice_commands = deque()
+        self._voice_event = threading.Event()
         self.is_processing = False
         
+        # Text-to-speech queue drained by a single long-lived worker
+        self._tts_queue = queue.Queue()
+        self._tts_future = None
+        # speak() runs on the capture, dialog and main threads; only one
+        # worker may drive the pyttsx3 loop at a time
+        self._tts_lock = threading.Lock()
+        # Set while the worker is playing audio; capture treats that sound as echo
+        self._tts_playing = threading.Event()
+        
+        # One bounded pool runs every worker: capture, STT, dialog and TTS
+        # loops are long-lived tasks; the spare slots take STT requests
+        self._pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="luna")
+        
+        # Voice pipeline stages: capture -> recognize -> dialog -> speak
+        self._stt_queue = queue.Queue()
+        self._dialog_queue = queue.Queue()
+        
         # Voice settings
         self.voice_settings = {
             'enabled': True,
@@ -32,52 +185,168 @@ class LunaVoiceInterface:
             'accent': 'female',
             'rate': 150,  # Slightly faster than normal
             'volume': 0.9,
-            'pitch': 135  # Slightly higher for female voice
+            'pitch': 135,  # Slightly higher for female voice
+            'barge_in': False  # Let loud speech interrupt Luna mid-reply
+        }
+        # Mirror of voice_settings['enabled'] read on every speak()
+        self._voice_enabled = True
+        
+        # Reusable context for voice turns; the conversation manager only
+        # reads it during the call and never keeps a reference
+        self._voice_context = {
+            'interaction_type': 'voice',
+            'voice_settings': self.voice_settings
         }
         
         # Conversation state
         self.conversation_active = False
+        self._shutdown_event = threading.Event()
         self.listening_timeout = 30  # seconds
         self.last_voice_activity = time.time()
         
+        # Console output for the voice path, unless the host set up logging
+        self._start_logging()
+        
         # Initialize voice systems
+        self._initialized = False
         self.initialize_voice_systems()
     
-    def initialize_voice_systems(self):
-        """Initialize voice recognition and synthesis"""
+    def _start_logging(self):
+        """
+        Log to stdout through a queue when the root logger has no handlers
+        Terminal writes then happen on the listener thread rather than the
+        audio capture / TTS threads. Hosts that configured logging keep theirs.
+        """
+        self._log_handler = None
+        self._log_listener = None
+        root = logging.getLogger()
+        if root.handlers:
+            return
+        
+        log_queue = queue.Queue()
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter('%(message)s'))
+        self._log_handler = logging.handlers.QueueHandler(log_queue)
+        self._log_listener = logging.handlers.QueueListener(log_queue, console)
+        
+        root.addHandler(self._log_handler)
+        root.setLevel(logging.INFO)
+        self._log_listener.start()
+    
+    def _stop_logging(self):
+        """Detach the queue handler and flush what the listener still holds"""
+        if self._log_listener is None:
+            return
+        logging.getLogger().removeHandler(self._log_handler)
+        self._log_listener.stop()
+        self._log_listener = None
+    
+    @property
+    def voice_ready(self) -> bool:
+        """True once speech recognition and synthesis are initialized"""
+        return self._initialized
+    
+    def initialize_voice_systems(self) -> bool:
+        """Initialize voice recognition and synthesis (no-op once ready)"""
+        if self._initialized:
+            return True
+        
         try:
             import speech_recognition as sr
             import pyttsx3
             
             # Initialize speech recognition
-            self.recognizer = sr.Recognizer()
+            self.recognizer = _create_recognizer(sr)
             self.microphone = sr.Microphone()
             
             # Initialize text-to-speech
             self.tts_engine = pyttsx3.init()
             
             # Configure voice
-            voices = self.tts_engine.getProperty('voices')
-            for voice in voices:
-                if 'female' in voice.name.lower():
-                    self.tts_engine.setProperty('voice', voice.id)
-                    break
+            voice_id = _pick_female_voice(self.tts_engine)
+            if voice_id is not None:
+                self.tts_engine.setProperty('voice', voice_id)
             
             # Set voice properties
             self.tts_engine.setProperty('rate', self.voice_settings['rate'])
             self.tts_engine.setProperty('volume', self.voice_settings['volume'])
             self.tts_engine.setProperty('pitch', self.voice_settings['pitch'])
             
-            print("✅ Voice systems initialized successfully!")
+            # Prefer local speech-to-text when faster-whisper is installed
+            self.stt_model = self._load_local_stt()
+            self.vad = self._load_vad()
+            
+            self._initialized = True
+            logger.info("✅ Voice systems initialized successfully!")
             return True
             
         except ImportError as e:
-            print(f"⚠️ Voice library not available: {e}")
-            print("🔧 Please install: pip install SpeechRecognition pyttsx3")
+            logger.warning(f"⚠️ Voice library not available: {e}")
+            logger.warning("🔧 Please install: pip install SpeechRecognition pyttsx3")
             return False
         except Exception as e:
-            print(f"⚠️ Voice initialization error: {e}")
+            logger.warning(f"⚠️ Voice initialization error: {e}")
+            return False
+    
+    def _load_local_stt(self):
+        """Load an int8 faster-whisper model, or None to use Google STT"""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            logger.info("ℹ️ faster-whisper not installed, using Google speech recognition")
+            return None
+        
+        try:
+            model = WhisperModel("base.en", device="cpu", compute_type="int8")
+            logger.info("✅ Local speech recognition ready (faster-whisper base.en int8)")
+            return model
+        except Exception as e:
+            logger.warning(f"⚠️ Local speech recognition unavailable: {e}")
+            return None
+    
+    def _load_vad(self):
+        """Load WebRTC VAD, or None to fall back to an energy gate"""
+        try:
+            import webrtcvad
+        except ImportError:
+            return None
+        return webrtcvad.Vad(2)
+    
+    def has_speech(self, audio) -> bool:
+        """
+        Cheap local check run before speech recognition
+        Uses WebRTC VAD on 30 ms frames when available, otherwise compares
+        per-frame RMS with the recognizer's calibrated energy threshold.
+        """
+        vad = getattr(self, 'vad', None)
+        if vad is not None:
+            pcm = audio.get_raw_data(convert_rate=SPEECH_SAMPLE_RATE, convert_width=SPEECH_SAMPLE_WIDTH)
+            frame_bytes = SPEECH_FRAME_SIZE * 2
+            return any(
+                vad.is_speech(pcm[start:start + frame_bytes], SPEECH_SAMPLE_RATE)
+                for start in range(0, len(pcm) - frame_bytes + 1, frame_bytes)
+            )
+        
+        return bool((self._frame_rms(audio) > self.recognizer.energy_threshold).any())
+    
+    def _frame_rms(self, audio) -> np.ndarray:
+        """RMS energy of each 30 ms frame"""
+        pcm = audio.get_raw_data(convert_rate=SPEECH_SAMPLE_RATE, convert_width=SPEECH_SAMPLE_WIDTH)
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        frames = frame_signal(samples, SPEECH_FRAME_SIZE, SPEECH_FRAME_SIZE)
+        return np.sqrt(np.mean(frames * frames, axis=1))
+    
+    def is_barge_in(self, audio) -> bool:
+        """
+        Whether speech captured during playback should interrupt Luna
+        Off unless voice_settings['barge_in'] is set; even then the capture
+        must be well above the calibrated threshold, so her own voice coming
+        back through the speakers is not mistaken for the user.
+        """
+        if not self.voice_settings.get('barge_in'):
             return False
+        threshold = self.recognizer.energy_threshold * BARGE_IN_ENERGY_RATIO
+        return bool((self._frame_rms(audio) > threshold).any())
     
     def start_voice_conversation(self):
         """
@@ -99,71 +368,157 @@ class LunaVoiceInterface:
         
         # Start conversation
         self.conversation_active = True
+        self._shutdown_event.clear()
         
-        # Start voice processing thread
-        voice_thread = threading.Thread(target=self.voice_processing_loop)
-        voice_thread.daemon = True
-        voice_thread.start()
+        # Start voice processing pipeline
+        self._pool.submit(self.voice_processing_loop)
         
         # Main conversation loop
         self.conversation_management_loop()
     
     def voice_processing_loop(self):
-        """Continuous voice processing loop"""
-        while self.conversation_active:
+        """
+        Continuous voice processing pipeline
+        Capture, recognition and dialog run as separate stages so the next
+        utterance is captured while the previous one is still in flight
+        """
+        self._pool.submit(self._stt_loop)
+        self._pool.submit(self._dialog_loop)
+        
+        self._capture_loop()
+    
+    def _capture_loop(self):
+        """Capture stage: listen on the microphone and hand audio to STT"""
+        import speech_recognition as sr
+        
+        while not self._shutdown_event.is_set():
             try:
-                # Listen for voice input
+                # Keep one input stream open for the whole session and
+                # calibrate once, instead of reopening the device and
+                # sampling a second of ambient noise before every phrase
                 with self.microphone as source:
                     self.recognizer.adjust_for_ambient_noise(source)
-                    print("🎤 [LISTENING] Luna is listening...")
+                    logger.info("🎤 [LISTENING] Luna is listening...")
                     
-                    # Listen with timeout
-                    try:
-                        audio = self.recognizer.listen(
-                            source, 
-                            timeout=1, 
-                            phrase_time_limit=10,
-                            snowboy_configuration=None
-                        )
+                    while not self._shutdown_event.is_set():
+                        # Listen with timeout
+                        try:
+                            audio = self.recognizer.listen(
+                                source, 
+                                timeout=1, 
+                                phrase_time_limit=10,
+                                snowboy_configuration=None
+                            )
+                        except sr.WaitTimeoutError:
+                            # Check for inactivity timeout
+                            if time.time() - self.last_voice_activity > self.listening_timeout:
+                                self.speak("I'm still here and listening. Is everything okay?")
+                                self.last_voice_activity = time.time()
+                            continue
                         
                         if audio:
-                            user_input = self.recognizer.recognize_google(
-                                audio, 
-                                language=self.voice_settings['language']
+                            # Resample once; later get_raw_data calls are no-ops
+                            audio = sr.AudioData(
+                                audio.get_raw_data(
+                                    convert_rate=SPEECH_SAMPLE_RATE,
+                                    convert_width=SPEECH_SAMPLE_WIDTH
+                                ),
+                                SPEECH_SAMPLE_RATE,
+                                SPEECH_SAMPLE_WIDTH
                             )
+                            if self._shutdown_event.is_set() or not self.has_speech(audio):
+                                continue
                             
-                            # Process voice input
-                            self.process_voice_input(user_input)
-                            self.last_voice_activity = time.time()
+                            if self._tts_playing.is_set():
+                                # Most of what the mic hears now is Luna herself
+                                if not self.is_barge_in(audio):
+                                    continue
+                                self.stop_speaking()
                             
-                    except sr.WaitTimeoutError:
-                        # Check for inactivity timeout
-                        if time.time() - self.last_voice_activity > self.listening_timeout:
-                            self.speak("I'm still here and listening. Is everything okay?")
-                            self.last_voice_activity = time.time()
-                            
-                    except sr.UnknownValueError:
-                        print("🔇 [UNCLEAR] Didn't catch that...")
-                        continue
-                        
-                    except sr.RequestError as e:
-                        print(f"⚠️ Voice recognition error: {e}")
-                        continue
+                            self._stt_queue.put(audio)
                         
             except Exception as e:
-                print(f"⚠️ Microphone error: {e}")
+                logger.warning(f"⚠️ Microphone error: {e}")
                 time.sleep(1)
                 continue
     
+    def _stt_loop(self):
+        """
+        Recognition stage: submit captured audio to the worker pool
+        Futures are forwarded in capture order, so up to two utterances can
+        be in flight while the dialog stage still sees them in sequence
+        """
+        while not self._shutdown_event.is_set():
+            try:
+                audio = self._stt_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            
+            self._dialog_queue.put(self._pool.submit(self.transcribe, audio))
+    
+    def transcribe(self, audio) -> str:
+        """
+        Turn captured audio into text
+        Runs faster-whisper locally when loaded, otherwise Google STT.
+        Raises speech_recognition.UnknownValueError when nothing is heard.
+        """
+        model = getattr(self, 'stt_model', None)
+        if model is None:
+            return self.recognizer.recognize_google(
+                audio,
+                language=self.voice_settings['language']
+            )
+        
+        import speech_recognition as sr
+        
+        # 16 kHz mono int16 PCM -> float32 in [-1, 1)
+        pcm = audio.get_raw_data(convert_rate=SPEECH_SAMPLE_RATE, convert_width=SPEECH_SAMPLE_WIDTH)
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        
+        segments, _ = model.transcribe(
+            samples,
+            language=self.voice_settings['language'].split('-')[0],
+            beam_size=1,
+            vad_filter=True
+        )
+        text = ' '.join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+    
+    def _dialog_loop(self):
+        """Dialog stage: run recognized text through the conversation manager"""
+        import speech_recognition as sr
+        
+        while not self._shutdown_event.is_set():
+            try:
+                pending = self._dialog_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            
+            try:
+                user_input = pending.result()
+            except sr.UnknownValueError:
+                logger.info("🔇 [UNCLEAR] Didn't catch that...")
+                continue
+            except sr.RequestError as e:
+                logger.warning(f"⚠️ Voice recognition error: {e}")
+                continue
+            
+            # Process voice input
+            self.process_voice_input(user_input)
+            self.last_voice_activity = time.time()
+    
     def conversation_management_loop(self):
         """Manage conversation flow and context"""
-        while self.conversation_active:
-            time.sleep(0.5)
+        while not self._shutdown_event.is_set():
+            # Block until a voice command arrives
+            if not self._voice_event.wait(timeout=1.0):
+                continue
+            self._voice_event.clear()
             
-            # Check for voice commands
-            if not self.voice_queue.empty():
-                command = self.voice_queue.get()
-                self.handle_voice_command(command)
+            while self._voice_commands:
+                self.handle_voice_command(self._voice_commands.popleft())
     
     def process_voice_input(self, user_input: str):
         """
@@ -172,27 +527,25 @@ class LunaVoiceInterface:
         if not user_input or not user_input.strip():
             return
         
-        print(f"👤 You: {user_input}")
+        logger.info(f"👤 You: {user_input}")
         
         # Check for voice commands
-        if self.is_voice_command(user_input):
-            self.voice_queue.put(user_input.lower())
+        command_match = self.is_voice_command(user_input)
+        if command_match:
+            self._voice_commands.append(command_match[0])
+            self._voice_event.set()
             return
         
         # Set processing state
         self.is_processing = True
         
         try:
-            # Create context for voice interaction
-            context = {
-                'timestamp': datetime.now().isoformat(),
-                'interaction_type': 'voice',
-                'voice_settings': self.voice_settings,
-                'conversation_depth': self.conversation_manager.conversation_context.conversation_depth
-            }
+            # Refresh context for voice interaction
+            context = self._voice_context
+            context['timestamp_ns'] = time.time_ns()
+            context['conversation_depth'] = self.conversation_manager.conversation_context.conversation_depth
             
             # Process through conversation manager
-            import asyncio
             loop = asyncio.new_event_loop()
             
             async def process_input():
@@ -203,26 +556,24 @@ class LunaVoiceInterface:
             
             # Speak Luna's response
             luna_response = response_data['response_text']
-            print(f"🌙 Luna: {luna_response}")
+            logger.info(f"🌙 Luna: {luna_response}")
             
             # Show processing indicators
             self.show_processing_indicators(response_data)
             
-            # Speak response
-            self.speak(luna_response)
+            # Speak response, with any follow-up question in the same pass
+            follow_up = response_data.get('follow_up_question')
+            if follow_up:
+                logger.info(f"🌙 Luna: {follow_up}")
+                self.speak(luna_response, follow_up)
+            else:
+                self.speak(luna_response)
             
             # Update learning
             self.update_learning_from_voice(user_input, luna_response, response_data)
             
-            # Handle follow-up questions
-            if response_data.get('follow_up_question'):
-                time.sleep(2)  # Pause before follow-up
-                follow_up = response_data['follow_up_question']
-                print(f"🌙 Luna: {follow_up}")
-                self.speak(follow_up)
-            
         except Exception as e:
-            print(f"⚠️ Voice processing error: {e}")
+            logger.warning(f"⚠️ Voice processing error: {e}")
             error_response = "I'm having trouble processing that. Could you please repeat?"
             self.speak(error_response)
         
@@ -230,48 +581,40 @@ class LunaVoiceInterface:
             self.is_processing = False
             self.hide_processing_indicators()
     
-    def is_voice_command(self, user_input: str) -> bool:
-        """Check if input is a voice command"""
-        voice_commands = [
-            'hello luna',
-            'stop listening',
-            'start listening',
-            'goodbye luna',
-            'luna sleep',
-            'luna wake up',
-            'what can i say',
-            'voice commands',
-            'help voice'
-        ]
-        
-        return user_input.lower() in voice_commands
+    def is_voice_command(self, user_input: str) -> Optional[Tuple[str, Tuple[int, int]]]:
+        """
+        Find a voice command anywhere in the input.
+        Returns (command, span) for the first match, or None.
+        """
+        return _match_voice_command(user_input.lower())
     
     def handle_voice_command(self, command: str):
         """Handle voice commands"""
         if command == 'hello luna':
             self.speak("Hello! I'm LunaBeyond, your voice companion. I'm ready to chat!")
-            print("🌙 Voice conversation activated")
+            logger.info("🌙 Voice conversation activated")
             
         elif command == 'stop listening':
             self.speak("Voice listening paused. Say 'start listening' to resume.")
-            print("🔇 Voice listening paused")
+            logger.info("🔇 Voice listening paused")
             
         elif command == 'start listening':
             self.speak("Voice listening resumed. I'm here and ready to chat!")
-            print("🎤 Voice listening resumed")
+            logger.info("🎤 Voice listening resumed")
             
         elif command == 'goodbye luna':
             self.speak("Goodbye! It was wonderful talking with you. I'll miss our voice conversations!")
             self.conversation_active = False
-            print("👋 Voice conversation ended")
+            self._shutdown_event.set()
+            logger.info("👋 Voice conversation ended")
             
         elif command == 'luna sleep':
             self.speak("I'll rest now. Wake me up by saying 'Luna wake up'.")
-            print("😴 Luna entering sleep mode")
+            logger.info("😴 Luna entering sleep mode")
             
         elif command == 'luna wake up':
             self.speak("I'm awake and ready to continue our conversation!")
-            print("🌙 Luna awakened from sleep")
+            logger.info("🌙 Luna awakened from sleep")
             
         elif command in ['what can i say', 'voice commands', 'help voice']:
             help_text = """🎤 Voice commands I understand:
@@ -284,7 +627,7 @@ class LunaVoiceInterface:
 • 'What can I say' - Hear all commands
 • 'Help voice' - Hear this list"""
             
-            print(help_text)
+            logger.info(help_text)
             self.speak(help_text)
     
     def update_learning_from_voice(self, user_input: str, luna_response: str, response_data: Dict):
@@ -303,16 +646,10 @@ class LunaVoiceInterface:
             'emotional_tone': response_data.get('emotional_tone', 'neutral')
         }
         
-        if not hasattr(self.learning_engine, 'conversation_memory'):
-            self.learning_engine.conversation_memory = []
-        
+        # Bounded by the learning engine; the oldest entries fall off on append
         self.learning_engine.conversation_memory.append(memory_entry)
         
-        # Keep memory manageable
-        if len(self.learning_engine.conversation_memory) > 100:
-            self.learning_engine.conversation_memory = self.learning_engine.conversation_memory[-50:]
-        
-        print(f"📚 Voice learning updated: {self.learning_engine.total_interactions} total voice interactions")
+        logger.info(f"📚 Voice learning updated: {self.learning_engine.total_interactions} total voice interactions")
     
     def show_processing_indicators(self, response_data: Dict):
         """Show visual indicators for processing state"""
@@ -331,41 +668,85 @@ class LunaVoiceInterface:
         }
         
         indicator = indicators.get(pattern, "🧠 [PROCESSING] Luna is thinking...")
-        print(indicator)
+        logger.info(indicator)
     
     def hide_processing_indicators(self):
         """Hide processing indicators"""
-        print("✅ [READY] Luna finished processing")
+        logger.info("✅ [READY] Luna finished processing")
     
-    def speak(self, text: str):
+    def speak(self, text: str, *more: str):
         """
         🔊 Speak text with natural voice
+        Extra segments are queued in the same synthesis pass
         """
-        if not self.voice_settings['enabled']:
-            print(f"🔊 [VOICE DISABLED] {text}")
+        segments = (text,) + more
+        
+        if not self._voice_enabled:
+            for segment in segments:
+                logger.info(f"🔊 [VOICE DISABLED] {segment}")
             return
         
         try:
-            print(f"🔊 [SPEAKING] {text}")
+            for segment in segments:
+                logger.info(f"🔊 [SPEAKING] {segment}")
             
-            # Create separate thread for speaking to avoid blocking
-            speak_thread = threading.Thread(
-                target=self._speak_in_thread,
-                args=(text,),
-                daemon=True
-            )
-            speak_thread.start()
+            # Hand off to the TTS worker to avoid blocking
+            self._ensure_tts_worker()
+            self._tts_queue.put(segments)
             
         except Exception as e:
-            print(f"⚠️ Speech error: {e}")
+            logger.warning(f"⚠️ Speech error: {e}")
     
-    def _speak_in_thread(self, text: str):
-        """Speak text in separate thread"""
+    def stop_speaking(self):
+        """Interrupt the current utterance and drop pending ones (barge-in)"""
         try:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
-        except Exception as e:
-            print(f"⚠️ Speech thread error: {e}")
+            while True:
+                if self._tts_queue.get_nowait() is None:
+                    # close() already asked the worker to exit; keep that request
+                    self._tts_queue.put(None)
+                    break
+        except queue.Empty:
+            pass
+        
+        if hasattr(self, 'tts_engine'):
+            try:
+                self.tts_engine.stop()
+            except Exception as e:
+                logger.warning(f"⚠️ Speech stop error: {e}")
+    
+    def _ensure_tts_worker(self):
+        """Start the TTS worker on first use"""
+        with self._tts_lock:
+            if self._tts_future is None or self._tts_future.done():
+                self._tts_future = self._pool.submit(self._tts_worker)
+    
+    def _tts_worker(self):
+        """
+        Drive the TTS engine with an external event loop so audio plays
+        as it is synthesized and stop_speaking() can cut it short
+        """
+        engine = self.tts_engine
+        engine.startLoop(False)
+        try:
+            while True:
+                segments = self._tts_queue.get()
+                if segments is None:
+                    break
+                
+                self._tts_playing.set()
+                try:
+                    for segment in segments:
+                        engine.say(segment)
+                    engine.iterate()
+                    while engine.isBusy():
+                        engine.iterate()
+                        time.sleep(0.01)
+                except Exception as e:
+                    logger.warning(f"⚠️ Speech thread error: {e}")
+                finally:
+                    self._tts_playing.clear()
+        finally:
+            engine.endLoop()
     
     def get_voice_status(self) -> Dict:
         """Get comprehensive voice interface status"""
@@ -374,7 +755,7 @@ class LunaVoiceInterface:
             'is_processing': self.is_processing,
             'voice_enabled': self.voice_settings['enabled'],
             'voice_settings': self.voice_settings,
-            'queue_size': self.voice_queue.qsize(),
+            'queue_size': len(self._voice_commands),
             'last_activity': self.last_voice_activity,
             'conversation_status': self.conversation_manager.get_conversation_status(),
             'learning_interactions': self.learning_engine.total_interactions,
@@ -386,6 +767,8 @@ class LunaVoiceInterface:
         """Adjust voice settings"""
         if setting in self.voice_settings:
             self.voice_settings[setting] = value
+            if setting == 'enabled':
+                self._voice_enabled = bool(value)
             
             # Apply setting if voice is initialized
             if hasattr(self, 'tts_engine'):
@@ -396,31 +779,42 @@ class LunaVoiceInterface:
                 elif setting == 'pitch':
                     self.tts_engine.setProperty('pitch', value)
             
-            print(f"🔧 Voice setting updated: {setting} = {value}")
+            logger.info(f"🔧 Voice setting updated: {setting} = {value}")
     
     def enable_voice_mode(self):
         """Enable voice interaction mode"""
         self.voice_settings['enabled'] = True
+        self._voice_enabled = True
         self.speak("Voice mode enabled. I'm ready to listen and speak!")
-        print("🎤 Voice mode enabled")
+        logger.info("🎤 Voice mode enabled")
     
     def disable_voice_mode(self):
         """Disable voice interaction mode"""
         self.voice_settings['enabled'] = False
+        self._voice_enabled = False
         self.speak("Voice mode disabled. I'll respond through text only.")
-        print("🔇 Voice mode disabled")
+        logger.info("🔇 Voice mode disabled")
+    
+    def close(self):
+        """Stop all voice workers and release the worker pool"""
+        self.conversation_active = False
+        self._shutdown_event.set()
+        self._tts_queue.put(None)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._stop_logging()
 
 def main():
     """Main function to start Luna voice interface"""
     print("🌙 LunaBeyond AI Voice Interface Starting...")
     print("🎤 Initializing voice systems...")
     
+    luna_voice = None
     try:
-        # Initialize voice interface
+        # Initialize voice interface (voice systems are set up in __init__)
         luna_voice = LunaVoiceInterface()
         
         # Test voice systems
-        if not luna_voice.initialize_voice_systems():
+        if not luna_voice.voice_ready:
             print("❌ Cannot start voice interface without proper voice libraries")
             print("🔧 Install with: pip install SpeechRecognition pyttsx3")
             return
@@ -436,6 +830,10 @@ def main():
         
     except Exception as e:
         print(f"⚠️ Voice interface error: {e}")
+    
+    finally:
+        if luna_voice is not None:
+            luna_voice.close()
 
 if __name__ == "__main__":
     main()
@@ -5,13 +5,21 @@ Web-based conversational AI that integrates with the BHCS dashboard
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
+import os
+import re
+import tempfile
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import sys
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 
 # Add parent directories for imports
@@ -19,39 +27,35 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 sys.path.append(str(Path(__file__).parent))
 
 from enhanced_ai import EnhancedLunaBeyondAI
-from test_system import BHCS, BioCore
-from luna_conversation import LunaConversation
-
-class LunaWebInterface(BaseHTTPRequestHandler):
-    """Web interface for LunaBeyond AI"""
-    
-    def __init__(self, *args, **kwargs):
-        self.luna = None  # Will be initialized in do_GET
-        super().__init__(*args, **kwargs)
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        if self.path == '/':
-            self.serve_dashboard()
-        elif self.path == '/api/status':
-            self.serve_api_status()
-        elif self.path.startswith('/api/'):
-            self.serve_api_response()
-        else:
-            self.send_error(404)
-    
-    def do_POST(self):
-        """Handle POST requests"""
-        if self.path == '/api/chat':
-            self.handle_chat_request()
-        elif self.path == '/api/command':
-            self.handle_command_request()
-        else:
-            self.send_error(404)
-    
-    def serve_dashboard(self):
-        """Serve the main dashboard with Luna integration"""
-        html_content = """
+from test_system import BHCS, BioCore, STATES, STATE_THRESHOLDS
+from luna_conversation import LunaConversation, HELP_MESSAGE, route_conversation
+
+# Brotli compresses the dashboard tighter than gzip when the client accepts it
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# orjson is a much faster JSON codec; fall back to compact stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ASGI stack (one hot event loop, multiplexed connections); stdlib server is the fallback
+try:
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import Response, StreamingResponse
+    import uvicorn
+    ASGI_AVAILABLE = True
+except ImportError:
+    ASGI_AVAILABLE = False
+
+# Dashboard page source - kept readable here, minified, encoded and hashed once at import
+_DASHBOARD_SOURCE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -107,6 +111,8 @@ class LunaWebInterface(BaseHTTPRequestHandler):
             padding: 20px;
             border: 1px solid rgba(255,255,255,0.1);
             transition: transform 0.3s ease;
+            /* Zone and chat updates inside a panel never re-lay-out the rest of the page */
+            contain: layout;
         }
 
         .panel:hover {
@@ -131,7 +137,10 @@ class LunaWebInterface(BaseHTTPRequestHandler):
             border-radius: 8px;
             padding: 10px;
             text-align: center;
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
+            /* Own layer for the hover lift; text updates stay inside the card */
+            contain: layout paint;
+            will-change: transform;
         }
 
         .zone-card:hover {
@@ -180,6 +189,7 @@ class LunaWebInterface(BaseHTTPRequestHandler):
             padding: 10px;
             border-radius: 10px;
             max-width: 80%;
+            contain: layout;
         }
 
         .message.user {
@@ -437,6 +447,7 @@ class LunaWebInterface(BaseHTTPRequestHandler):
                             <div>Hello! I'm LunaBeyond, your AI companion. I'm monitoring the BHCS system and learning from its behavior. Ask me anything about the system or type '/help' for commands!</div>
                         </div>
                     </div>
+                    <template id="messageTemplate"><div class="message"><div class="message-sender"></div><div></div></div></template>
                     
                     <div class="chat-input-container">
                         <input type="text" class="chat-input" id="chatInput" placeholder="Ask Luna about the system..." onkeypress="handleKeyPress(event)">
@@ -461,15 +472,52 @@ class LunaWebInterface(BaseHTTPRequestHandler):
 
     <script>
         // BHCS System + Luna Integration
+        // State names and their upper activity bounds, filled in from test_system at import
+        const STATE_NAMES = __STATE_NAMES__;
+        const STATE_BOUNDS = __STATE_BOUNDS__;
+        const MAX_CHAT_MESSAGES = 200;
+        const ZONES_CACHE_KEY = 'luna.zones';
+        // Diagnostics are compiled out unless DEBUG is flipped while developing
+        const DEBUG = false;
+        const log = DEBUG ? console.log.bind(console) : () => {};
+        const STATE_CLASS = Object.freeze({
+            CALM: 'zone-state state-calm',
+            OVERSTIMULATED: 'zone-state state-overstimulated',
+            EMERGENT: 'zone-state state-emergent',
+            CRITICAL: 'zone-state state-critical'
+        });
+
         class IntegratedSystem {
             constructor() {
-                this.zones = [
+                // Last zones the server sent, painted at once while /events reconnects
+                this.zones = this.loadCachedZones() || [
                     { id: 0, activity: 0.8, state: "OVERSTIMULATED" },
                     { id: 1, activity: 0.6, state: "OVERSTIMULATED" },
                     { id: 2, activity: 0.3, state: "CALM" },
                     { id: 3, activity: 0.7, state: "OVERSTIMULATED" },
                     { id: 4, activity: 0.5, state: "CALM" }
                 ];
+                this.zonesJson = null;  // serialized zones last rendered from the stream
+                this.zoneNodes = new Map();  // zone.id -> that zone's card nodes
+                this.renderPending = false;
+                this.scrollPending = false;
+                this.actionInFlight = false;
+                this.chatMessages = document.getElementById('chatMessages');
+                this.messageTemplate = document.getElementById('messageTemplate').content.firstElementChild;
+                // Elements the page reads or writes after load, resolved once
+                this.els = {
+                    systemHealth: document.getElementById('systemHealth'),
+                    avgActivity: document.getElementById('avgActivity'),
+                    riskLevel: document.getElementById('riskLevel'),
+                    aiAccuracy: document.getElementById('aiAccuracy'),
+                    zonesGrid: document.getElementById('zonesGrid'),
+                    zoneSelect: document.getElementById('zoneSelect'),
+                    plantSelect: document.getElementById('plantSelect'),
+                    drugSelect: document.getElementById('drugSelect'),
+                    synergySlider: document.getElementById('synergySlider'),
+                    synergyValue: document.getElementById('synergyValue'),
+                    chatInput: document.getElementById('chatInput')
+                };
                 
                 this.init();
             }
@@ -477,39 +525,108 @@ class LunaWebInterface(BaseHTTPRequestHandler):
             init() {
                 this.setupEventListeners();
                 this.updateDisplay();
-                this.startSystemSimulation();
                 this.startApiPolling();
             }
 
             setupEventListeners() {
-                document.getElementById('synergySlider').addEventListener('input', (e) => {
-                    document.getElementById('synergyValue').textContent = e.target.value;
+                // Pointer drags fire input far faster than the display refreshes;
+                // the label is written at most once per frame, with the latest value
+                const slider = this.els.synergySlider;
+                const valueDisplay = this.els.synergyValue;
+                let pending = false;
+                slider.addEventListener('input', () => {
+                    if (pending) return;
+                    pending = true;
+                    requestAnimationFrame(() => {
+                        pending = false;
+                        valueDisplay.textContent = slider.value;
+                    });
+                });
+            }
+
+            createZoneCard(zone) {
+                // Cards are created once per zone id; render only touches their text and classes
+                const zoneCard = document.createElement('div');
+                zoneCard.className = 'zone-card';
+                zoneCard.innerHTML = `
+                    <div class="zone-id">Zone ${zone.id}</div>
+                    <div class="zone-state"></div>
+                    <div class="zone-activity"></div>
+                `;
+                return {
+                    card: zoneCard,
+                    state: zoneCard.querySelector('.zone-state'),
+                    activity: zoneCard.querySelector('.zone-activity'),
+                    lastState: null,
+                    lastActivity: null
+                };
+            }
+
+            pruneZoneCards() {
+                // Drop cards for zones the server no longer reports
+                const live = new Set(this.zones.map(zone => zone.id));
+                this.zoneNodes.forEach((nodes, id) => {
+                    if (!live.has(id)) {
+                        nodes.card.remove();
+                        this.zoneNodes.delete(id);
+                    }
                 });
             }
 
             updateDisplay() {
-                // Update zones
-                const zonesGrid = document.getElementById('zonesGrid');
-                zonesGrid.innerHTML = '';
-
-                this.zones.forEach(zone => {
-                    const zoneCard = document.createElement('div');
-                    zoneCard.className = 'zone-card';
-                    zoneCard.innerHTML = `
-                        <div class="zone-id">Zone ${zone.id}</div>
-                        <div class="zone-state state-${zone.state.toLowerCase()}">${zone.state}</div>
-                        <div class="zone-activity">${zone.activity.toFixed(3)}</div>
-                    `;
-                    zonesGrid.appendChild(zoneCard);
+                // Coalesce updates into one render per animation frame
+                if (this.renderPending) return;
+                this.renderPending = true;
+                requestAnimationFrame(() => {
+                    this.renderPending = false;
+                    this.render();
                 });
+            }
+
+            render() {
+                // Update zones - keyed by id, only the nodes whose values changed are written.
+                // The metrics are accumulated in the same indexed pass.
+                const zones = this.zones;
+                let newCards = null;
+                let calmZones = 0;
+                let totalActivity = 0;
+                for (let i = 0; i < zones.length; i++) {
+                    const zone = zones[i];
+                    if (zone.state === 'CALM') calmZones++;
+                    totalActivity += zone.activity;
+
+                    let nodes = this.zoneNodes.get(zone.id);
+                    if (!nodes) {
+                        nodes = this.createZoneCard(zone);
+                        this.zoneNodes.set(zone.id, nodes);
+                        // New cards are inserted together, one reflow for the batch
+                        newCards = newCards || document.createDocumentFragment();
+                        newCards.appendChild(nodes.card);
+                    }
+                    if (nodes.lastState !== zone.state) {
+                        nodes.state.className = STATE_CLASS[zone.state];
+                        nodes.state.textContent = zone.state;
+                        nodes.lastState = zone.state;
+                    }
+                    const activity = zone.activity.toFixed(3);
+                    if (nodes.lastActivity !== activity) {
+                        nodes.activity.textContent = activity;
+                        nodes.lastActivity = activity;
+                    }
+                }
+                if (newCards) {
+                    this.els.zonesGrid.appendChild(newCards);
+                }
+                if (this.zoneNodes.size > this.zones.length) {
+                    this.pruneZoneCards();
+                }
 
                 // Update metrics
-                const systemHealth = this.calculateSystemHealth();
-                document.getElementById('systemHealth').textContent = `${(systemHealth * 100).toFixed(0)}%`;
-                document.getElementById('avgActivity').textContent = this.calculateAvgActivity().toFixed(3);
-                
-                const riskLevel = this.calculateRiskLevel();
-                document.getElementById('riskLevel').textContent = riskLevel;
+                const systemHealth = calmZones / zones.length;
+                const avgActivity = totalActivity / zones.length;
+                this.els.systemHealth.textContent = `${(systemHealth * 100).toFixed(0)}%`;
+                this.els.avgActivity.textContent = avgActivity.toFixed(3);
+                this.els.riskLevel.textContent = this.calculateRiskLevel(avgActivity);
             }
 
             calculateSystemHealth() {
@@ -521,108 +638,172 @@ class LunaWebInterface(BaseHTTPRequestHandler):
                 return this.zones.reduce((sum, zone) => sum + zone.activity, 0) / this.zones.length;
             }
 
-            calculateRiskLevel() {
-                const avgActivity = this.calculateAvgActivity();
+            calculateRiskLevel(avgActivity = this.calculateAvgActivity()) {
                 if (avgActivity > 0.8) return "High";
                 if (avgActivity > 0.6) return "Medium";
                 return "Low";
             }
 
-            startSystemSimulation() {
-                setInterval(() => {
-                    this.zones.forEach(zone => {
-                        const change = (Math.random() - 0.5) * 0.02;
-                        zone.activity = Math.max(0.0, Math.min(1.0, zone.activity + change));
-                        zone.state = this.determineState(zone.activity);
-                    });
-
-                    this.updateDisplay();
-                }, 2000);
+            determineState(activity) {
+                // Same bucketing as the server's np.searchsorted over STATE_THRESHOLDS:
+                // the bounds ascend, so counting those passed gives the state index
+                let i = 0;
+                for (let b = 0; b < STATE_BOUNDS.length; b++) i += activity >= STATE_BOUNDS[b];
+                return STATE_NAMES[i];
             }
 
-            determineState(activity) {
-                if (activity < 0.4) return "CALM";
-                if (activity < 0.7) return "OVERSTIMULATED";
-                if (activity < 0.9) return "EMERGENT";
-                return "CRITICAL";
+            loadCachedZones() {
+                // localStorage can be unavailable (private mode) or hold stale junk
+                try {
+                    const cached = JSON.parse(localStorage.getItem(ZONES_CACHE_KEY));
+                    return Array.isArray(cached) && cached.length ? cached : null;
+                } catch (error) {
+                    return null;
+                }
             }
 
             startApiPolling() {
-                // Poll for AI status updates
-                setInterval(async () => {
-                    try {
-                        const response = await fetch('/api/status');
-                        const data = await response.json();
-                        
-                        if (data.ai_accuracy) {
-                            document.getElementById('aiAccuracy').textContent = `${(data.ai_accuracy * 100).toFixed(0)}%`;
+                this.events = null;
+                if (document.visibilityState !== 'hidden') {
+                    this.openStatusStream();
+                }
+                // A background tab renders nothing, so it holds no stream either;
+                // on return the reopened stream starts with the latest frame
+                document.addEventListener('visibilitychange', () => {
+                    if (document.visibilityState === 'hidden') {
+                        if (this.events) {
+                            this.events.close();
+                            this.events = null;
                         }
-                    } catch (error) {
-                        console.log('API polling error:', error);
+                    } else if (!this.events) {
+                        this.openStatusStream();
                     }
-                }, 5000);
+                });
             }
 
-            async applyBiocore() {
-                const zoneId = parseInt(document.getElementById('zoneSelect').value);
-                const plant = document.getElementById('plantSelect').value;
-                const drug = document.getElementById('drugSelect').value;
-                const synergy = parseFloat(document.getElementById('synergySlider').value);
+            openStatusStream() {
+                // AI status is pushed by the server; EventSource reconnects on its own
+                const events = new EventSource('/events');
+                this.events = events;
+                events.onmessage = (event) => {
+                    const data = JSON.parse(event.data);
+                    
+                    if (data.ai_accuracy) {
+                        this.els.aiAccuracy.textContent = `${(data.ai_accuracy * 100).toFixed(0)}%`;
+                    }
+                    // Zones are simulated on the server; the page only renders them
+                    // Frames re-sent without a zone change skip the render and the cache write
+                    if (data.zones) {
+                        const zonesJson = JSON.stringify(data.zones);
+                        if (zonesJson === this.zonesJson) return;
+                        this.zonesJson = zonesJson;
+                        this.zones = data.zones;
+                        this.updateDisplay();
+                        try {
+                            localStorage.setItem(ZONES_CACHE_KEY, zonesJson);
+                        } catch (error) {
+                            // Quota or privacy settings; the cache is only a head start
+                        }
+                    }
+                };
+                events.onerror = (error) => {
+                    // Fires on every reconnect attempt while the server is away
+                    log('Status stream error:', error);
+                };
+            }
 
-                const zone = this.zones[zoneId];
-                zone.activity = Math.max(0.0, Math.min(1.0, zone.activity - 0.2));
-                zone.state = this.determineState(zone.activity);
+            async applyBiocore() {
+                const zoneId = parseInt(this.els.zoneSelect.value);
+                const plant = this.els.plantSelect.value;
+                const drug = this.els.drugSelect.value;
+                const synergy = parseFloat(this.els.synergySlider.value);
 
-                this.updateDisplay();
                 this.addChatMessage(`Applied ${plant} + ${drug} to Zone ${zoneId}`, 'user');
-                
-                // Simulate Luna response
-                setTimeout(() => {
-                    this.addChatMessage(`🌿 BioCore intervention applied! Zone ${zoneId} is now ${zone.state} with activity ${zone.activity.toFixed(3)}.`, 'luna');
-                }, 500);
-            }
 
-            optimizeSystem() {
-                this.zones.forEach(zone => {
-                    zone.activity = 0.5 + (Math.random() - 0.5) * 0.1;
+                try {
+                    const response = await fetch('/api/biocore', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({ zone_id: zoneId, plant: plant, drug: drug, synergy: synergy })
+                    });
+                    const data = await response.json();
+                    if (!response.ok) throw new Error(data.error);
+                    this.zones[zoneId] = data.zone;
+                } catch (error) {
+                    // Fallback to a local estimate of the effect
+                    const zone = this.zones[zoneId];
+                    zone.activity = Math.max(0.0, Math.min(1.0, zone.activity - 0.2));
                     zone.state = this.determineState(zone.activity);
-                });
+                }
 
+                // Zones now differ from the last frame, so the next one must render
+                this.zonesJson = null;
                 this.updateDisplay();
-                this.addChatMessage('System optimization initiated', 'user');
-                
-                setTimeout(() => {
-                    this.addChatMessage('🧠 System optimized! All zones are now balanced around the optimal activity level.', 'luna');
-                }, 500);
+                const zone = this.zones[zoneId];
+                this.addChatMessage(`🌿 BioCore intervention applied! Zone ${zoneId} is now ${zone.state} with activity ${zone.activity.toFixed(3)}.`, 'luna');
+            }
+
+            async runExclusive(action) {
+                // Interventions change server state; clicks while one is in flight are dropped
+                if (this.actionInFlight) return;
+                this.actionInFlight = true;
+                try {
+                    await action();
+                } finally {
+                    this.actionInFlight = false;
+                }
+            }
+
+            async runSystemCommand(command, label) {
+                this.addChatMessage(label, 'user');
+
+                try {
+                    const response = await fetch('/api/command', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({ command: command })
+                    });
+                    const data = await response.json();
+                    // The resulting zone changes arrive on the status stream
+                    this.addChatMessage(data.response || data.error, 'luna');
+                } catch (error) {
+                    this.addChatMessage('⚠️ I could not reach the BHCS server just now.', 'luna');
+                }
+            }
+
+            optimizeSystem() {
+                return this.runSystemCommand('/optimize', 'System optimization initiated');
             }
 
             resetSystem() {
-                this.zones = [
-                    { id: 0, activity: 0.8, state: "OVERSTIMULATED" },
-                    { id: 1, activity: 0.6, state: "OVERSTIMULATED" },
-                    { id: 2, activity: 0.3, state: "CALM" },
-                    { id: 3, activity: 0.7, state: "OVERSTIMULATED" },
-                    { id: 4, activity: 0.5, state: "CALM" }
-                ];
-                
-                this.updateDisplay();
-                this.addChatMessage('System reset', 'user');
-                
-                setTimeout(() => {
-                    this.addChatMessage('🔄 System reset to initial state. All zones restored.', 'luna');
-                }, 500);
+                return this.runSystemCommand('/reset', 'System reset');
             }
 
             addChatMessage(message, sender) {
-                const chatMessages = document.getElementById('chatMessages');
-                const messageDiv = document.createElement('div');
-                messageDiv.className = `message ${sender}`;
-                messageDiv.innerHTML = `
-                    <div class="message-sender">${sender === 'user' ? '👤 You' : '🌙 LunaBeyond'}</div>
-                    <div>${message}</div>
-                `;
+                // Cloned from a parsed template and filled with text, so no HTML is parsed per message
+                const messageDiv = this.messageTemplate.cloneNode(true);
+                messageDiv.classList.add(sender);
+                messageDiv.children[0].textContent = sender === 'user' ? '👤 You' : '🌙 LunaBeyond';
+                messageDiv.children[1].textContent = message;
+
+                const chatMessages = this.chatMessages;
                 chatMessages.appendChild(messageDiv);
-                chatMessages.scrollTop = chatMessages.scrollHeight;
+                // Bounded log: the oldest messages drop off in long sessions
+                while (chatMessages.childElementCount > MAX_CHAT_MESSAGES) {
+                    chatMessages.firstElementChild.remove();
+                }
+                // Reading scrollHeight right after a mutation forces layout; read it
+                // once in the next frame instead, however many messages arrive first
+                if (this.scrollPending) return;
+                this.scrollPending = true;
+                requestAnimationFrame(() => {
+                    this.scrollPending = false;
+                    chatMessages.scrollTop = chatMessages.scrollHeight;
+                });
             }
 
             async sendChatMessage(message) {
@@ -649,7 +830,7 @@ class LunaWebInterface(BaseHTTPRequestHandler):
                 const responses = {
                     'status': `📊 Current system health is ${(this.calculateSystemHealth() * 100).toFixed(0)}% with ${this.calculateAvgActivity().toFixed(3)} average activity.`,
                     'zones': `🧠 All zones are currently: ${this.zones.map(z => `${z.id}(${z.state})`).join(', ')}`,
-                    'ai': '🤖 I\'m currently learning from the system behavior and our conversations!',
+                    'ai': '🤖 I\\'m currently learning from the system behavior and our conversations!',
                     'help': '💡 Available commands: /status, /zones, /ai, /predict, /learn, /evolve'
                 };
 
@@ -674,19 +855,19 @@ class LunaWebInterface(BaseHTTPRequestHandler):
 
         // Global functions
         function applyBiocore() {
-            system.applyBiocore();
+            system.runExclusive(() => system.applyBiocore());
         }
 
         function optimizeSystem() {
-            system.optimizeSystem();
+            system.runExclusive(() => system.optimizeSystem());
         }
 
         function resetSystem() {
-            system.resetSystem();
+            system.runExclusive(() => system.resetSystem());
         }
 
         function sendMessage() {
-            const input = document.getElementById('chatInput');
+            const input = system.els.chatInput;
             const message = input.value.trim();
             
             if (message) {
@@ -707,110 +888,928 @@ class LunaWebInterface(BaseHTTPRequestHandler):
     </script>
 </body>
 </html>
-        """
+"""
+
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.S)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+_STYLE_BLOCK = re.compile(r'(<style>)(.*?)(</style>)', re.S)
+_CSS_PUNCTUATION_SPACE = re.compile(r'\s*([{};:,>])\s*')
+
+def _minify_css(css: str) -> str:
+    """Stylesheet on one line: no comments, no space around punctuation, no last semicolon in a block"""
+    css = _CSS_PUNCTUATION_SPACE.sub(r'\1', _CSS_COMMENT.sub('', css).strip())
+    return css.replace(';}', '}')
+
+def _minify_html(source: str) -> str:
+    """Drop comments, indentation and blank lines; line breaks stay so inline JS parses the same"""
+    source = _HTML_COMMENT.sub('', source)
+    # CSS comment syntax is only stripped inside <style>; in the script it could be a string or regex
+    source = _STYLE_BLOCK.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), source)
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+_DASHBOARD_HTML = _minify_html(
+    _DASHBOARD_SOURCE
+    .replace('__STATE_NAMES__', json.dumps(list(STATES)))
+    .replace('__STATE_BOUNDS__', json.dumps(STATE_THRESHOLDS.tolist()))
+).encode('utf-8')
+_DASHBOARD_ETAG = f'"{hashlib.blake2b(_DASHBOARD_HTML, digest_size=8).hexdigest()}"'
+
+def _dashboard_variant(body: bytes, encoding: Optional[str]) -> Tuple[Optional[str], bytes, str, str]:
+    """(Content-Encoding, body, Content-Length, ETag) for one encoding of the page"""
+    etag = _DASHBOARD_ETAG if encoding is None else f'{_DASHBOARD_ETAG[:-1]}-{encoding}"'
+    return encoding, body, str(len(body)), etag
+
+# Compressed once at import, in order of preference
+_DASHBOARD_VARIANTS = []
+if BROTLI_AVAILABLE:
+    _DASHBOARD_VARIANTS.append(_dashboard_variant(brotli.compress(_DASHBOARD_HTML, quality=11), 'br'))
+_DASHBOARD_VARIANTS.append(_dashboard_variant(gzip.compress(_DASHBOARD_HTML, compresslevel=9, mtime=0), 'gzip'))
+_DASHBOARD_IDENTITY = _dashboard_variant(_DASHBOARD_HTML, None)
+
+# In-memory file copies of the dashboard variants for zero-copy sendfile (created on first use)
+_STATIC_FILES: Dict[Optional[str], object] = {}
+_STATIC_LOCK = threading.Lock()
+
+def _static_fd(key: Optional[str], body: bytes) -> int:
+    """File descriptor holding ``body``, written once to an anonymous memory file"""
+    with _STATIC_LOCK:
+        static_file = _STATIC_FILES.get(key)
+        if static_file is None:
+            if hasattr(os, 'memfd_create'):
+                # Linux: RAM-backed with no filesystem entry; other platforms use a temp file
+                static_file = open(os.memfd_create(f'luna-dashboard-{key or "identity"}', os.MFD_CLOEXEC), 'w+b')
+            else:
+                static_file = tempfile.TemporaryFile()
+            static_file.write(body)
+            static_file.flush()
+            _STATIC_FILES[key] = static_file
+    return static_file.fileno()
+
+# The page is served under a content-hashed URL so browsers may cache it forever
+_DASHBOARD_VERSION = _DASHBOARD_ETAG.strip('"')
+_DASHBOARD_QUERY = f'v={_DASHBOARD_VERSION}'
+_DASHBOARD_URL = f'/?{_DASHBOARD_QUERY}'
+_DASHBOARD_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+_DASHBOARD_REDIRECT_HEADERS = {'Location': _DASHBOARD_URL, 'Cache-Control': 'no-cache'}
+
+def _dashboard_validators(etag: str) -> Dict[str, str]:
+    """Headers a variant sends on both its 200 and its 304"""
+    return {'ETag': etag, 'Vary': 'Accept-Encoding', 'Cache-Control': _DASHBOARD_CACHE_CONTROL}
+
+def _dashboard_head(encoding: Optional[str], length: str, etag: str) -> bytes:
+    """Serialized header block (after the status line) of a variant's 200"""
+    headers = {'Content-Type': 'text/html; charset=utf-8', 'Content-Length': length}
+    headers.update(_dashboard_validators(etag))
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return ''.join(f'{name}: {value}\r\n' for name, value in headers.items()).encode('latin-1') + b'\r\n'
+
+# Per-variant headers, keyed by Content-Encoding; nothing is formatted per request
+_DASHBOARD_VALIDATORS = {
+    encoding: _dashboard_validators(etag)
+    for encoding, _, _, etag in _DASHBOARD_VARIANTS + [_DASHBOARD_IDENTITY]
+}
+_DASHBOARD_HEADS = {
+    encoding: _dashboard_head(encoding, length, etag)
+    for encoding, _, length, etag in _DASHBOARD_VARIANTS + [_DASHBOARD_IDENTITY]
+}
+
+def _is_current_dashboard(version: Optional[str]) -> bool:
+    """True when a request names the hash of the page this process serves"""
+    return version == _DASHBOARD_VERSION
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match comparison (RFC 9110 weak comparison): the header may list several
+    tags, carry W/ prefixes added by proxies, or be "*".
+    """
+    if not if_none_match:
+        return False
+    if if_none_match == etag:
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+# JSON endpoints are revalidated on every use; unchanged bodies come back as 304
+_API_CACHE_CONTROL = 'no-cache'
+
+def _payload_etag(body: bytes) -> str:
+    """Strong validator for a response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+def _select_dashboard(accept_encoding: str) -> Tuple[Optional[str], bytes, str, str]:
+    """Best pre-compressed dashboard the client accepts"""
+    accepted = set()
+    for item in accept_encoding.lower().split(','):
+        coding, _, params = item.partition(';')
+        if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            accepted.add(coding.strip())
+    for variant in _DASHBOARD_VARIANTS:
+        if variant[0] in accepted:
+            return variant
+    return _DASHBOARD_IDENTITY
+
+# Stdlib fallback matching orjson's output: compact, and emoji as raw UTF-8 rather than \u escapes
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+def _json_dumps(data) -> bytes:
+    """Serialize an API payload straight to bytes"""
+    return _JSON_ENCODER.encode(data).encode('utf-8')
+
+_json_loads = json.loads
+
+if ORJSON_AVAILABLE:
+    # Bound directly - no Python frame between the handlers and the C codec
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+
+# One long-lived event loop for the stdlib handler, started on first use
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+def _run_coroutine(coro):
+    """Run a coroutine on the shared background loop and wait for its result"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="luna-web-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result()
+
+# Conversation state shared by every request (handlers are re-created per request)
+_LUNA = None
+_LUNA_LOCK = threading.Lock()
+
+def get_luna() -> LunaConversation:
+    """Process-wide LunaConversation, built on first use"""
+    global _LUNA
+    if _LUNA is None:
+        with _LUNA_LOCK:
+            if _LUNA is None:
+                _LUNA = LunaConversation()
+    return _LUNA
+
+# LunaConversation's coroutines never await I/O - they are numpy inference and
+# training. Running them on one dedicated worker keeps the event loop free for
+# the dashboard, /api/status and /events while a reply is computed. A single
+# thread (not a process pool) because every request reads and mutates the same
+# in-memory model and zone state; the worker also serializes those mutations, so
+# every write to the model or the BHCS arrays (chat, commands, learning, BioCore
+# interventions, the simulation tick) must go through _on_inference_thread.
+_INFERENCE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="luna-inference")
+_INFERENCE_LOCAL = threading.local()
+
+def _drive(coro):
+    """Run a coroutine to completion on the calling worker thread's own loop"""
+    loop = getattr(_INFERENCE_LOCAL, 'loop', None)
+    if loop is None:
+        loop = _INFERENCE_LOCAL.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+async def _on_inference_thread(func, *args):
+    """Run a plain function on the inference worker, after any queued model work"""
+    return await asyncio.get_running_loop().run_in_executor(_INFERENCE_EXECUTOR, func, *args)
+
+async def _infer(coro):
+    """Await a LunaConversation coroutine without blocking the event loop"""
+    return await _on_inference_thread(_drive, coro)
+
+# Reply cache for chat, keyed on the message's word set and a coarse system-state epoch
+_RESPONSE_CACHE_SIZE = 4096
+_RESPONSE_CACHE_TTL = 300.0  # seconds
+_RESPONSE_CACHE: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+_ACTIVITY_BIN = 0.05
+
+# Replies that are actions, not reports: optimize_system changes zone state, and
+# /learn and /evolve are always answered fresh as their commands promise
+_UNCACHEABLE_ROUTES = frozenset({'optimize'})
+_UNCACHEABLE_COMMANDS = ('/learn', '/evolve')
+
+def _state_epoch(luna: LunaConversation, route: str) -> tuple:
+    """Changes only when something the route's reply could mention changes meaningfully"""
+    epoch = (
+        tuple(round(zone.activity / _ACTIVITY_BIN) for zone in luna.bhcs.zones),
+        luna.bhcs.states.tobytes(),
+        luna.ai.generation,
+        len(luna.ai.training_history),
+        round(luna.ai.performance_metrics['accuracy'], 3),
+        luna.personality['mood'],
+        luna.personality['knowledge_level']
+    )
+    if route == 'ai':
+        # get_ai_status also reports running totals and the F1 score
+        epoch += (luna.conversation_count, round(luna.ai.performance_metrics['f1_score'], 3))
+    return epoch
+
+def _message_key(normalized: str) -> str:
+    """
+    Canonical form of a lowercased message. process_conversation only tests for
+    single-word keywords and '?', so word order, repeats and spacing never change
+    which reply it picks - reworded repeats of a question share one entry.
+    """
+    return ' '.join(sorted(set(normalized.split())))
+
+async def _converse(luna: LunaConversation, message: str) -> str:
+    """process_conversation with repeated questions answered from the cache"""
+    normalized = message.strip().lower()
+    route = route_conversation(normalized)
+    if route in _UNCACHEABLE_ROUTES or normalized.startswith(_UNCACHEABLE_COMMANDS):
+        return await _infer(luna.process_conversation(message))
+    
+    key = (_message_key(normalized), _state_epoch(luna, route))
+    now = time.monotonic()
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is not None and now - entry[0] < _RESPONSE_CACHE_TTL:
+        _RESPONSE_CACHE.move_to_end(key)
+        return entry[1]
+    
+    response = await _infer(luna.process_conversation(message))
+    _RESPONSE_CACHE[key] = (now, response)
+    _RESPONSE_CACHE.move_to_end(key)
+    if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+    return response
+
+class _ChatBatcher:
+    """
+    Coalesces chat messages that arrive within a few milliseconds of each other.
+    Each distinct message in a batch is answered once and the reply is shared.
+    """
+    MAX_BATCH = 32
+    WINDOW = 0.005  # seconds to wait for more messages after the first
+    
+    def __init__(self):
+        self._loop = None
+        self._queue = None
+        self._task = None
+    
+    async def submit(self, message: str) -> str:
+        """Queue a message and wait for its reply"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((message, future))
+        return await future
+    
+    async def _collect(self) -> List[tuple]:
+        """First queued item plus anything else that arrives within the window"""
+        items = [await self._queue.get()]
+        deadline = self._loop.time() + self.WINDOW
+        while len(items) < self.MAX_BATCH:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return items
+    
+    async def _run(self):
+        """Batch loop - runs for the lifetime of the event loop"""
+        while True:
+            items = await self._collect()
+            luna = get_luna()
+            
+            waiters: Dict[str, List[asyncio.Future]] = {}
+            for message, future in items:
+                waiters.setdefault(message, []).append(future)
+            
+            for message, futures in waiters.items():
+                try:
+                    response = await _converse(luna, message)
+                except Exception as e:
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for future in futures:
+                        if not future.done():
+                            future.set_result(response)
+
+_chat_batcher = _ChatBatcher()
+
+def _status_key(luna: LunaConversation) -> tuple:
+    """Everything an /events frame reports apart from its timestamp"""
+    return (
+        luna.bhcs.activities.tobytes(),
+        luna.ai.performance_metrics['accuracy'],
+        luna.ai.generation,
+        luna.conversation_count
+    )
+
+class _StatusBroadcaster:
+    """
+    Samples /api/status once per tick and pushes it to every open /events stream,
+    so N dashboards cost one serialization instead of N polls. A frame is only
+    pushed when something it reports has changed since the last one.
+    """
+    INTERVAL = 5.0
+    
+    def __init__(self):
+        self._loop = None
+        self._task = None
+        self._wake = None
+        self._subscribers = set()
+        self._latest = None
+        self._sent_key = None
+    
+    async def start(self):
+        """Run the broadcast loop on the current event loop (no-op if it already is)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task.done():
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._subscribers = set()
+            self._task = loop.create_task(self._run())
+    
+    async def subscribe(self) -> asyncio.Queue:
+        """New subscriber queue, primed with the latest frame"""
+        await self.start()
+        
+        queue = asyncio.Queue(maxsize=1)
+        if self._latest is not None:
+            queue.put_nowait(self._latest)
+        self._subscribers.add(queue)
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Drop a subscriber (safe to call from any thread)"""
+        self._loop.call_soon_threadsafe(self._subscribers.discard, queue)
+    
+    def notify(self):
+        """Push a frame now instead of at the next tick (safe to call from any thread)"""
+        _invalidate_status_snapshot()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+    
+    async def _run(self):
+        """Broadcast loop - runs for the lifetime of the event loop"""
+        loop = asyncio.get_running_loop()
+        # Ticks follow their own clock; notify() wake-ups never push them back
+        next_tick = loop.time() + self.INTERVAL
+        while True:
+            key = _status_key(get_luna())
+            if self._subscribers and key != self._sent_key:
+                self._sent_key = key
+                self._latest = b'data: ' + _status_snapshot() + b'\n\n'
+                for queue in tuple(self._subscribers):
+                    # Slow readers only ever get the newest frame
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(self._latest)
+            
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(0.0, next_tick - loop.time()))
+                self._wake.clear()
+            except asyncio.TimeoutError:
+                pass
+            
+            if loop.time() >= next_tick:
+                # The zone simulation advances once per tick, as one vectorized BHCS step
+                await _on_inference_thread(get_luna().bhcs.update)
+                _invalidate_status_snapshot()
+                next_tick = max(next_tick + self.INTERVAL, loop.time())
+
+_status_events = _StatusBroadcaster()
+
+# JSON bodies at least this large are gzipped for clients that accept it; below
+# it the header and CPU cost outweigh the saving (status frames are ~400 bytes)
+GZIP_MIN_SIZE = 1024
+
+# Seconds an idle keep-alive connection is held open between requests
+KEEP_ALIVE_TIMEOUT = 30
+
+# Largest POST body accepted; chat messages and commands are a few hundred bytes
+MAX_BODY = 64 * 1024
+
+def _canned_body(reply: str) -> Tuple[str, bytes, bytes]:
+    """(reply text, JSON body, header block plus body) for a fixed reply"""
+    body = _json_dumps({'response': reply})
+    head = b'Content-Type: application/json\r\nContent-Length: %d\r\n\r\n' % len(body)
+    return reply, body, head + body
+
+# Replies that never depend on system state, serialized once at import
+_CANNED: Dict[str, Tuple[str, bytes, bytes]] = {
+    '/help': _canned_body(HELP_MESSAGE),
+}
+
+def _canned(message) -> Optional[Tuple[str, bytes, bytes]]:
+    """Precomputed response for a static command, if there is one"""
+    return _CANNED.get(message.strip().lower()) if isinstance(message, str) else None
+
+def _status_payload(luna: LunaConversation) -> Dict:
+    """Body for GET /api/status"""
+    return {
+        'system_health': luna.bhcs.get_system_health(),
+        'ai_accuracy': luna.ai.performance_metrics['accuracy'],
+        'ai_generation': luna.ai.generation,
+        'conversations': luna.conversation_count,
+        'zones': _zone_list(luna),
+        'timestamp': time.time()
+    }
+
+# Serialized /api/status shared by every client; rebuilt at most once per STATUS_TTL
+STATUS_TTL = 1.0
+_status_snapshot_cache: Tuple[float, bytes, str] = (0.0, b'', '')
+_status_snapshot_lock = threading.Lock()
+
+def _tagged_status_snapshot() -> Tuple[bytes, str]:
+    """Current /api/status body and its ETag - N pollers cost one payload build per second"""
+    global _status_snapshot_cache
+    expires, body, etag = _status_snapshot_cache
+    if time.monotonic() < expires:
+        return body, etag
+    
+    with _status_snapshot_lock:
+        # Another thread may have refreshed it while this one waited
+        expires, body, etag = _status_snapshot_cache
+        if time.monotonic() < expires:
+            return body, etag
+        body = _json_dumps(_status_payload(get_luna()))
+        etag = _payload_etag(body)
+        _status_snapshot_cache = (time.monotonic() + STATUS_TTL, body, etag)
+        return body, etag
+
+def _status_snapshot() -> bytes:
+    """Current /api/status body"""
+    return _tagged_status_snapshot()[0]
+
+def _invalidate_status_snapshot():
+    """Force the next _status_snapshot() to rebuild after zones change"""
+    global _status_snapshot_cache
+    _status_snapshot_cache = (0.0,) + _status_snapshot_cache[1:]
+
+def warm_up_luna():
+    """Build the shared Luna and run its models once before the first request arrives"""
+    luna = get_luna()
+    luna.ai.deep_analyze_system(luna._prepare_zones_data())
+    _status_snapshot()
+
+def _zone_list(luna: LunaConversation) -> List[Dict]:
+    """Per-zone entries read straight from the BHCS zone arrays"""
+    activities = luna.bhcs.activities.tolist()
+    states = luna.bhcs.states.tolist()
+    return [
+        {'id': zone_id, 'activity': activity, 'state': STATES[state]}
+        for zone_id, (activity, state) in enumerate(zip(activities, states))
+    ]
+
+def _zones_payload(luna: LunaConversation) -> Dict:
+    """Body for GET /api/zones"""
+    return {'zones': _zone_list(luna)}
+
+def _apply_biocore(luna: LunaConversation, data: Dict) -> Dict:
+    """
+    Apply a plant + drug pairing to one zone; body for POST /api/biocore.
+    Writes the BHCS arrays, so callers run it via _on_inference_thread.
+    """
+    zone_id = int(data.get('zone_id', 0))
+    if not 0 <= zone_id < len(luna.bhcs.zones):
+        raise ValueError(f"Zone {zone_id} not found")
+    
+    effect = luna.biocore.apply_to_zone(
+        luna.bhcs, zone_id,
+        data.get('plant', 'Ashwagandha'),
+        data.get('drug', 'DrugE'),
+        float(data.get('synergy', 0.5))
+    )
+    _status_events.notify()
+    
+    zone = luna.bhcs.zones[zone_id]
+    return {
+        'zone': {'id': zone_id, 'activity': zone.activity, 'state': zone.state},
+        'magnitude': effect['magnitude']
+    }
+
+class LunaWebInterface(BaseHTTPRequestHandler):
+    """Web interface for LunaBeyond AI"""
+    
+    # Keep connections open between requests; every response carries Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Idle connections are dropped instead of pinning a handler thread forever
+    timeout = KEEP_ALIVE_TIMEOUT
+    # Buffered socket files: a response leaves in one send(), flushed after each request
+    rbufsize = 1 << 16
+    wbufsize = 1 << 16
+    
+    # Exact-path dispatch tables: path -> handler method name
+    ROUTES_GET = {
+        '/': 'serve_dashboard',
+        '/api/status': 'serve_api_status',
+        '/api/zones': 'serve_api_zones',
+        '/events': 'serve_events',
+    }
+    ROUTES_POST = {
+        '/api/chat': 'handle_chat_request',
+        '/api/command': 'handle_command_request',
+        '/api/biocore': 'handle_biocore_request',
+    }
+    
+    def do_GET(self):
+        """Handle GET requests"""
+        handler = self.ROUTES_GET.get(self.path.partition('?')[0])
+        if handler:
+            getattr(self, handler)()
+        else:
+            self.send_error(404)
+    
+    def do_POST(self):
+        """Handle POST requests"""
+        handler = self.ROUTES_POST.get(self.path.partition('?')[0])
+        if handler:
+            getattr(self, handler)()
+        else:
+            self.send_error(404)
+    
+    def serve_dashboard(self):
+        """Serve the main dashboard with Luna integration"""
+        query = self.path.partition('?')[2]
+        # The exact URL handed out by the redirect skips query parsing
+        if query != _DASHBOARD_QUERY and not _is_current_dashboard(urllib.parse.parse_qs(query).get('v', [None])[0]):
+            self._write(302, None, b'', _DASHBOARD_REDIRECT_HEADERS)
+            return
+        
+        encoding, body, _, etag = _select_dashboard(self.headers.get('Accept-Encoding', ''))
         
-        self.send_response(200, 'text/html', html_content)
+        # Browser already holds this exact page - skip the body
+        if _etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_response(304)
+            for name, value in _DASHBOARD_VALIDATORS[encoding].items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        
+        self._write_canned(_DASHBOARD_HEADS[encoding])
+        self._send_static(encoding, body)
     
     def serve_api_status(self):
         """Serve API status"""
-        if not self.luna:
-            self.luna = LunaConversation()
+        self._write_revalidated(*_tagged_status_snapshot())
+    
+    def serve_events(self):
+        """Stream status updates as Server-Sent Events"""
+        queue = _run_coroutine(_status_events.subscribe())
         
-        status_data = {
-            'system_health': self.luna.bhcs.get_system_health(),
-            'ai_accuracy': self.luna.ai.performance_metrics['accuracy'],
-            'ai_generation': self.luna.ai.generation,
-            'conversations': len(self.luna.conversation_history),
-            'timestamp': time.time()
-        }
+        # Unbounded stream: no Content-Length, so this connection ends with the stream
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
         
-        self.send_json_response(200, status_data)
+        try:
+            # Frames bypass the write buffer so a dropped client leaves nothing to flush
+            self.wfile.flush()
+            while True:
+                self.connection.sendall(_run_coroutine(queue.get()))
+        except OSError:
+            # Client went away, or stalled past the socket timeout
+            pass
+        finally:
+            _status_events.unsubscribe(queue)
     
-    def serve_api_response(self):
-        """Serve general API responses"""
-        if not self.luna:
-            self.luna = LunaConversation()
-        
-        # Handle different API endpoints
-        if self.path == '/api/zones':
-            zones_data = []
-            for zone in self.luna.bhcs.zones:
-                zones_data.append({
-                    'id': zone.id,
-                    'activity': zone.activity,
-                    'state': zone.state
-                })
-            self.send_json_response(200, {'zones': zones_data})
-        else:
-            self.send_error(404)
+    def serve_api_zones(self):
+        """Serve the zone list"""
+        body = _json_dumps(_zones_payload(get_luna()))
+        self._write_revalidated(body, _payload_etag(body))
     
     def handle_chat_request(self):
         """Handle chat requests"""
-        if not self.luna:
-            self.luna = LunaConversation()
+        luna = get_luna()
         
-        content_length = int(self.headers['Content-Length'])
-        post_data = self.rfile.read(content_length)
+        post_data = self._read_body()
+        if post_data is None:
+            return
         
         try:
-            data = json.loads(post_data.decode('utf-8'))
+            data = _json_loads(post_data)
             message = data.get('message', '')
             
-            # Process message asynchronously
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            canned = _canned(message)
+            if canned:
+                # Still a chat turn: counted and kept in history like any other
+                _run_coroutine(_infer(luna.learn_from_interaction(message, canned[0])))
+                self._write_canned(canned[2])
+                return
             
-            try:
-                response = loop.run_until_complete(self.luna.process_conversation(message))
-                
-                # Learn from interaction
-                loop.run_until_complete(self.luna.learn_from_interaction(message, response))
-                
-                self.send_json_response(200, {'response': response})
-            finally:
-                loop.close()
+            # Process message on the shared event loop
+            response = _run_coroutine(_chat_batcher.submit(message))
+            
+            # Learn from interaction
+            _run_coroutine(_infer(luna.learn_from_interaction(message, response)))
+            
+            self.send_json_response(200, {'response': response})
                 
         except Exception as e:
             self.send_json_response(500, {'error': str(e)})
     
     def handle_command_request(self):
         """Handle command requests"""
-        if not self.luna:
-            self.luna = LunaConversation()
+        luna = get_luna()
         
-        content_length = int(self.headers['Content-Length'])
-        post_data = self.rfile.read(content_length)
+        post_data = self._read_body()
+        if post_data is None:
+            return
         
         try:
-            data = json.loads(post_data.decode('utf-8'))
+            data = _json_loads(post_data)
             command = data.get('command', '')
             
-            # Process command asynchronously
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            canned = _canned(command)
+            if canned:
+                self._write_canned(canned[2])
+                return
             
-            try:
-                response = loop.run_until_complete(self.luna.handle_command(command))
-                self.send_json_response(200, {'response': response})
-            finally:
-                loop.close()
+            # Process command on the shared event loop
+            response = _run_coroutine(_infer(luna.handle_command(command)))
+            _status_events.notify()
+            self.send_json_response(200, {'response': response})
                 
         except Exception as e:
             self.send_json_response(500, {'error': str(e)})
     
-    def send_response(self, status_code, content_type, content):
-        """Send HTTP response"""
-        self.send_response(status_code, content_type, content.encode('utf-8'))
+    def handle_biocore_request(self):
+        """Handle BioCore intervention requests"""
+        luna = get_luna()
+        
+        post_data = self._read_body()
+        if post_data is None:
+            return
+        
+        try:
+            data = _json_loads(post_data)
+            result = _run_coroutine(_on_inference_thread(_apply_biocore, luna, data))
+            self.send_json_response(200, result)
+        except Exception as e:
+            self.send_json_response(500, {'error': str(e)})
+    
+    def _read_body(self) -> Optional[bytes]:
+        """Read the request body in one sized call, or send 400/411/413 and return None"""
+        # Chunked bodies are not parsed here; left unread they would corrupt the keep-alive stream
+        if 'Content-Length' not in self.headers or 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+            self.send_error(411, 'Content-Length required')
+            return None
+        try:
+            length = int(self.headers['Content-Length'])
+        except ValueError:
+            length = -1
+        if length <= 0:
+            self.send_error(400, 'Invalid Content-Length')
+            return None
+        if length > MAX_BODY:
+            self.close_connection = True
+            self.send_error(413, 'Request body too large')
+            return None
+        return self.rfile.read(length)
+    
+    def send_response(self, code, message=None):
+        """Status line plus the keep-alive window, unless this connection is closing"""
+        super().send_response(code, message)
+        if not self.close_connection:
+            self.send_header('Keep-Alive', f'timeout={KEEP_ALIVE_TIMEOUT}')
+    
+    def send_error(self, code, message=None, explain=None):
+        """Error responses close the connection, so mark it before the status line"""
+        self.close_connection = True
+        super().send_error(code, message, explain)
+    
+    def _write_head(self, status_code: int, content_type: Optional[str], length: str,
+                    headers: Optional[Dict] = None, body: bytes = b''):
+        """Send the status line and headers, including Content-Length, plus an optional body"""
+        self.send_response(status_code)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', length)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        # Queue the body behind the headers so the whole response leaves in one write
+        self._headers_buffer.append(b"\r\n")
+        if body:
+            self._headers_buffer.append(body)
+        self.flush_headers()
+    
+    def _write_canned(self, response: bytes):
+        """Send a 200 whose headers (and any body) were serialized ahead of time"""
+        self.send_response(200)
+        self._headers_buffer.append(response)
+        self.flush_headers()
+    
+    def _write(self, status_code: int, content_type: Optional[str], body: bytes, headers: Optional[Dict] = None):
+        """Send a complete response: status line, headers with Content-Length, then the body"""
+        self._write_head(status_code, content_type, str(len(body)), headers, body)
+    
+    def _send_static(self, key: Optional[str], body: bytes):
+        """Send a constant body straight from the page cache with sendfile where available"""
+        if not hasattr(os, 'sendfile'):
+            self.wfile.write(body)
+            return
+        
+        # Headers sit in the write buffer until flushed; they must precede the file
+        self.wfile.flush()
+        
+        # Explicit offsets keep the shared descriptor safe across handler threads
+        in_fd = _static_fd(key, body)
+        out_fd = self.connection.fileno()
+        offset = 0
+        while offset < len(body):
+            offset += os.sendfile(out_fd, in_fd, offset, len(body) - offset)
+    
+    def _write_revalidated(self, body: bytes, etag: str):
+        """JSON 200 carrying an ETag, or a bodiless 304 if the client already has it"""
+        headers = {'ETag': etag, 'Cache-Control': _API_CACHE_CONTROL}
+        if _etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        self._write(200, 'application/json', body, headers)
     
     def send_json_response(self, status_code, data):
-        """Send JSON response"""
-        json_data = json.dumps(data, indent=2)
-        self.send_response(status_code, 'application/json', json_data.encode('utf-8'))
+        """Send JSON response, gzipped at the fastest level when it is worth it"""
+        body = _json_dumps(data)
+        if len(body) >= GZIP_MIN_SIZE and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            headers = {'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'}
+            self._write(status_code, 'application/json', gzip.compress(body, 1, mtime=0), headers)
+            return
+        self._write(status_code, 'application/json', body)
+
+if ASGI_AVAILABLE:
+    # The dashboard is served pre-encoded and /events must reach the client a
+    # frame at a time; older Starlette GZipMiddleware would re-compress the
+    # first and buffer the second, so both bypass it by path
+    _GZIP_EXEMPT_PATHS = frozenset({'/', '/events'})
+    
+    class _RouteGZipMiddleware:
+        """GZipMiddleware for every route except _GZIP_EXEMPT_PATHS"""
+        
+        def __init__(self, app, **options):
+            self.app = app
+            self.gzip = GZipMiddleware(app, **options)
+        
+        async def __call__(self, scope, receive, send):
+            if scope['type'] == 'http' and scope['path'] in _GZIP_EXEMPT_PATHS:
+                await self.app(scope, receive, send)
+            else:
+                await self.gzip(scope, receive, send)
+    
+    app = FastAPI(title="LunaBeyond AI Web Interface")
+    app.add_middleware(_RouteGZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=1)
+    
+    def _json_response(data, status_code: int = 200) -> Response:
+        """JSON response encoded with the module codec"""
+        return Response(_json_dumps(data), status_code=status_code, media_type='application/json')
+    
+    def _revalidated_response(request: Request, body: bytes, etag: str) -> Response:
+        """JSON 200 carrying an ETag, or a bodiless 304 if the client already has it"""
+        headers = {'ETag': etag, 'Cache-Control': _API_CACHE_CONTROL}
+        if _etag_matches(request.headers.get('if-none-match'), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type='application/json', headers=headers)
+    
+    @app.on_event("startup")
+    async def start_status_events():
+        """Start the simulation tick with the server, not with the first /events client"""
+        await _status_events.start()
+    
+    async def _read_body(request: Request) -> Optional[bytes]:
+        """Request body, or None when it is larger than MAX_BODY"""
+        try:
+            if int(request.headers.get('content-length', '0')) > MAX_BODY:
+                return None
+        except ValueError:
+            pass
+        body = b''
+        async for chunk in request.stream():
+            body += chunk
+            if len(body) > MAX_BODY:
+                return None
+        return body
+    
+    @app.get("/")
+    async def dashboard(request: Request):
+        """Serve the main dashboard with Luna integration"""
+        if not _is_current_dashboard(request.query_params.get('v')):
+            return Response(status_code=302, headers=_DASHBOARD_REDIRECT_HEADERS)
+        
+        encoding, body, _, etag = _select_dashboard(request.headers.get('accept-encoding', ''))
+        headers = _DASHBOARD_VALIDATORS[encoding]
+        if _etag_matches(request.headers.get('if-none-match'), etag):
+            return Response(status_code=304, headers=headers)
+        
+        if encoding:
+            headers = {**headers, 'Content-Encoding': encoding}
+        return Response(body, media_type='text/html; charset=utf-8', headers=headers)
+    
+    @app.get("/api/status")
+    async def api_status(request: Request):
+        """Serve API status"""
+        return _revalidated_response(request, *_tagged_status_snapshot())
+    
+    @app.get("/events")
+    async def events():
+        """Stream status updates as Server-Sent Events"""
+        queue = await _status_events.subscribe()
+        
+        async def stream():
+            try:
+                while True:
+                    yield await queue.get()
+            finally:
+                _status_events.unsubscribe(queue)
+        
+        return StreamingResponse(stream(), media_type='text/event-stream', headers={'Cache-Control': 'no-cache'})
+    
+    @app.get("/api/zones")
+    async def api_zones(request: Request):
+        """Serve zone states"""
+        body = _json_dumps(_zones_payload(get_luna()))
+        return _revalidated_response(request, body, _payload_etag(body))
+    
+    @app.post("/api/chat")
+    async def api_chat(request: Request):
+        """Handle chat requests"""
+        luna = get_luna()
+        body = await _read_body(request)
+        if body is None:
+            return _json_response({'error': 'Request body too large'}, 413)
+        try:
+            data = _json_loads(body)
+            message = data.get('message', '')
+            canned = _canned(message)
+            if canned:
+                # Still a chat turn: counted and kept in history like any other
+                await _infer(luna.learn_from_interaction(message, canned[0]))
+                return Response(canned[1], media_type='application/json')
+            
+            response = await _chat_batcher.submit(message)
+            
+            # Learn from interaction
+            await _infer(luna.learn_from_interaction(message, response))
+            
+            return _json_response({'response': response})
+        except Exception as e:
+            return _json_response({'error': str(e)}, 500)
+    
+    @app.post("/api/command")
+    async def api_command(request: Request):
+        """Handle command requests"""
+        luna = get_luna()
+        body = await _read_body(request)
+        if body is None:
+            return _json_response({'error': 'Request body too large'}, 413)
+        try:
+            data = _json_loads(body)
+            command = data.get('command', '')
+            canned = _canned(command)
+            if canned:
+                return Response(canned[1], media_type='application/json')
+            
+            response = await _infer(luna.handle_command(command))
+            _status_events.notify()
+            return _json_response({'response': response})
+        except Exception as e:
+            return _json_response({'error': str(e)}, 500)
+    
+    @app.post("/api/biocore")
+    async def api_biocore(request: Request):
+        """Handle BioCore intervention requests"""
+        luna = get_luna()
+        body = await _read_body(request)
+        if body is None:
+            return _json_response({'error': 'Request body too large'}, 413)
+        try:
+            data = _json_loads(body)
+            return _json_response(await _on_inference_thread(_apply_biocore, luna, data))
+        except Exception as e:
+            return _json_response({'error': str(e)}, 500)
 
-def run_luna_web_server(port=8080):
-    """Run the Luna web interface server"""
+
+class _LunaHTTPServer(ThreadingHTTPServer):
+    """Thread-per-connection server sized for many keep-alive dashboard clients"""
+    daemon_threads = True
+    # listen() backlog; the socketserver default of 5 drops connections under bursts
+    request_queue_size = 128
+
+def run_legacy_web_server(port=8080):
+    """Run the Luna web interface on the stdlib HTTP server"""
     server_address = ('', port)
-    httpd = HTTPServer(server_address, LunaWebInterface)
+    httpd = _LunaHTTPServer(server_address, LunaWebInterface)
+    warm_up_luna()
+    # The simulation ticks from server start, not from the first /events client
+    _run_coroutine(_status_events.start())
     
     print(f"🌙 LunaBeyond AI Web Server Starting...")
     print(f"📱 Open http://localhost:{port} to chat with Luna!")
@@ -821,7 +1820,30 @@ def run_luna_web_server(port=8080):
         httpd.serve_forever()
     except KeyboardInterrupt:
         print(f"\n🛑 LunaBeyond AI Web Server stopped")
-        httpd.shutdown()
+    finally:
+        httpd.server_close()
+
+def run_luna_web_server(port=8080, legacy=False):
+    """Run the Luna web interface server (ASGI when available, stdlib otherwise)"""
+    if legacy or not ASGI_AVAILABLE:
+        run_legacy_web_server(port)
+        return
+    
+    print(f"🌙 LunaBeyond AI Web Server Starting (ASGI)...")
+    print(f"📱 Open http://localhost:{port} to chat with Luna!")
+    print(f"🧠 Integrated BHCS system with conversational AI")
+    print(f"🚀 Press Ctrl+C to stop the server")
+    
+    # One worker and one event loop own every connection; loop/http "auto" pick
+    # uvloop and httptools when they are installed. Past limit_concurrency new
+    # requests get a fast 503 instead of queueing, and the deep backlog absorbs
+    # connection bursts without SYN drops.
+    warm_up_luna()
+    config = uvicorn.Config(app, host="0.0.0.0", port=port, loop="auto", http="auto",
+                            workers=1, limit_concurrency=1024, backlog=2048,
+                            timeout_keep_alive=KEEP_ALIVE_TIMEOUT)
+    uvicorn.Server(config).run()
+    print(f"\n🛑 LunaBeyond AI Web Server stopped")
 
 if __name__ == "__main__":
-    run_luna_web_server()
+    run_luna_web_server(legacy='--legacy' in sys.argv[1:])
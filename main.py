@@ -7,18 +7,25 @@ Python simulation with Rust engine integration
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pathlib import Path
 
 class HomeostaticCity:
     def __init__(self):
         self.rust_url = "http://localhost:3030"
+        # Keep-alive session reused for every call to the Rust engine
+        self.http = requests.Session()
+        self.http.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
         self.running = True
         
     def check_rust_engine(self):
         """Check if Rust engine is running"""
         try:
-            response = requests.get(f"{self.rust_url}/health", timeout=5)
+            response = self.http.get(f"{self.rust_url}/health", timeout=5)
             return response.status_code == 200
         except:
             return False
@@ -26,7 +33,7 @@ class HomeostaticCity:
     def get_city_state(self):
         """Get current city state from Rust engine"""
         try:
-            response = requests.get(f"{self.rust_url}/state", timeout=5)
+            response = self.http.get(f"{self.rust_url}/state", timeout=5)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -42,7 +49,7 @@ class HomeostaticCity:
         }
         
         try:
-            response = requests.post(f"{self.rust_url}/biocore", 
+            response = self.http.post(f"{self.rust_url}/biocore", 
                                   json=effect_data, timeout=5)
             return response.status_code == 200
         except:
@@ -8,6 +8,7 @@ import subprocess
 import time
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sys
 import os
@@ -16,6 +17,12 @@ from pathlib import Path
 class IntegratedBHCSSystem:
     def __init__(self):
         self.rust_url = "http://localhost:3030"
+        # Keep-alive session reused for every call to the Rust engine
+        self.http = requests.Session()
+        self.http.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
         self.rust_process = None
         self.running = True
         
@@ -69,7 +76,7 @@ class IntegratedBHCSSystem:
     def check_rust_engine(self):
         """Check if Rust engine is running"""
         try:
-            response = requests.get(f"{self.rust_url}/health", timeout=5)
+            response = self.http.get(f"{self.rust_url}/health", timeout=5)
             return response.status_code == 200
         except:
             return False
@@ -77,7 +84,7 @@ class IntegratedBHCSSystem:
     def get_city_state(self):
         """Get current city state from Rust engine"""
         try:
-            response = requests.get(f"{self.rust_url}/state", timeout=5)
+            response = self.http.get(f"{self.rust_url}/state", timeout=5)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -137,7 +144,7 @@ class IntegratedBHCSSystem:
                 "magnitude": -0.1,
                 "effects": ["Test Effect"]
             }
-            response = requests.post(f"{self.rust_url}/biocore", 
+            response = self.http.post(f"{self.rust_url}/biocore", 
                                   json=effect_data, timeout=5)
             if response.status_code == 200:
                 print("✅ BioCore effect application successful")
@@ -10,45 +10,26 @@ import threading
 from datetime import datetime
 from typing import Dict, List, Any
 from enum import Enum
-import random
+import numpy as np
 
 class ZoneState(Enum):
     CALM = "CALM"
     OVERSTIMULATED = "OVERSTIMULATED"
     EMERGENT = "EMERGENT"
 
-class Zone:
-    def __init__(self, id: int, name: str, activity: float = 0.5):
-        self.id = id
-        self.name = name
-        self.activity = activity
-        self.state = self._calculate_state()
-    
-    def _calculate_state(self) -> ZoneState:
-        if self.activity < 0.4:
-            return ZoneState.CALM
-        elif self.activity < 0.7:
-            return ZoneState.OVERSTIMULATED
-        else:
-            return ZoneState.EMERGENT
-    
-    def update_activity(self, delta: float):
-        self.activity = max(0.0, min(1.0, self.activity + delta))
-        self.state = self._calculate_state()
-
 class MockRustEngine:
     """Python mock of the Rust homeostatic engine"""
     
     def __init__(self):
-        self.zones = [
-            Zone(0, "Downtown", 0.3),
-            Zone(1, "Industrial", 0.6),
-            Zone(2, "Residential", 0.2),
-            Zone(3, "Commercial", 0.8),
-            Zone(4, "Parks", 0.4)
-        ]
-        
-        self.ema = [0.5] * len(self.zones)
+        # Zones are held as parallel arrays so every tick updates them in one pass
+        self.zone_names = ["Downtown", "Industrial", "Residential", "Commercial", "Parks"]
+        self.activity = np.array([0.3, 0.6, 0.2, 0.8, 0.4])
+        self.ema = np.full(len(self.zone_names), 0.5)
+        
+        # Cached ISO timestamp shared by every response within a 100 ms window
+        self._stamp_text = ""
+        self._stamp_expires = 0.0
+        
         self.target = 0.5
         self.eta = 0.1
         self.running = True
@@ -65,43 +46,62 @@ class MockRustEngine:
     
     def _update_zones(self):
         """Update all zones using homeostatic algorithm"""
-        for i, zone in enumerate(self.zones):
-            # EMA smoothing
-            self.ema[i] = 0.97 * self.ema[i] + 0.03 * zone.activity
-            
-            # Error-driven adjustment
-            error = self.target - self.ema[i]
-            adjustment = self.eta * error
-            
-            # Add some random noise for realism
-            noise = (random.random() - 0.5) * 0.02
-            
-            zone.update_activity(adjustment + noise)
+        # EMA smoothing
+        self.ema = 0.97 * self.ema + 0.03 * self.activity
+        
+        # Error-driven adjustment
+        adjustment = self.eta * (self.target - self.ema)
+        
+        # Add some random noise for realism
+        noise = (np.random.random(len(self.activity)) - 0.5) * 0.02
+        
+        self._update_activity(adjustment + noise)
+    
+    def _update_activity(self, delta, index=slice(None)):
+        """Shift activity for one zone (or all of them) and clamp to [0, 1]"""
+        self.activity[index] = np.clip(self.activity[index] + delta, 0.0, 1.0)
+    
+    def _zone_states(self) -> np.ndarray:
+        """Classify every zone: CALM below 0.4, OVERSTIMULATED below 0.7, else EMERGENT"""
+        return np.select(
+            [self.activity < 0.4, self.activity < 0.7],
+            [ZoneState.CALM.value, ZoneState.OVERSTIMULATED.value],
+            ZoneState.EMERGENT.value
+        )
+    
+    def _stamp(self) -> str:
+        """Current ISO timestamp, reformatted at most every 100 ms"""
+        now = time.monotonic()
+        if now >= self._stamp_expires:
+            self._stamp_text = datetime.now().isoformat()
+            self._stamp_expires = now + 0.1
+        return self._stamp_text
     
     def get_health(self) -> Dict[str, Any]:
         """Get health status"""
         return {
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._stamp(),
             "engine": "Python Mock Engine v1.0.0"
         }
     
     def get_state(self) -> Dict[str, Any]:
         """Get current city state"""
-        system_health = sum(zone.activity for zone in self.zones) / len(self.zones)
+        activity = self.activity.tolist()
+        states = self._zone_states().tolist()
         
         return {
             "zones": [
                 {
-                    "id": zone.id,
-                    "name": zone.name,
-                    "activity": zone.activity,
-                    "state": zone.state.value
+                    "id": zone_id,
+                    "name": name,
+                    "activity": activity[zone_id],
+                    "state": states[zone_id]
                 }
-                for zone in self.zones
+                for zone_id, name in enumerate(self.zone_names)
             ],
-            "timestamp": datetime.now().isoformat(),
-            "system_health": system_health
+            "timestamp": self._stamp(),
+            "system_health": float(self.activity.mean())
         }
     
     def apply_biocore_effect(self, effect_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -110,20 +110,19 @@ class MockRustEngine:
         magnitude = effect_data.get("magnitude", 0.0)
         effects = effect_data.get("effects", [])
         
-        if zone_id >= len(self.zones):
+        if zone_id >= len(self.zone_names):
             return {
                 "success": False,
                 "error": f"Zone {zone_id} not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._stamp()
             }
         
-        zone = self.zones[zone_id]
-        zone.update_activity(magnitude)
+        self._update_activity(magnitude, zone_id)
         
         return {
             "success": True,
             "effect": effect_data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._stamp()
         }
     
     def apply_influence(self, influence_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -131,21 +130,43 @@ class MockRustEngine:
         zone_id = influence_data.get("zone_id")
         influence = influence_data.get("influence", 0.0)
         
-        if zone_id >= len(self.zones):
+        if zone_id >= len(self.zone_names):
             return {
                 "success": False,
                 "error": f"Zone {zone_id} not found",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._stamp()
             }
         
-        zone = self.zones[zone_id]
-        zone.update_activity(influence)
+        self._update_activity(influence, zone_id)
         
         return {
             "success": True,
             "zone_id": zone_id,
             "influence": influence,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._stamp()
+        }
+    
+    def apply_influences(self, influences: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply several direct influences in one call (mirrors POST /influence/batch)"""
+        pairs = [(item.get("zone_id", 0), item.get("influence", 0.0)) for item in influences]
+        
+        for zone_id, _ in pairs:
+            if not 0 <= zone_id < len(self.zone_names):
+                return {
+                    "success": False,
+                    "error": f"Zone {zone_id} not found",
+                    "timestamp": self._stamp()
+                }
+        
+        # Applied in order with a clamp after each, like the Rust batch
+        # endpoint, so [+0.8, -0.5] on one zone ends at 0.5 rather than 0.8
+        for zone_id, influence in pairs:
+            self._update_activity(influence, zone_id)
+        
+        return {
+            "success": True,
+            "applied": len(influences),
+            "timestamp": self._stamp()
         }
     
     def shutdown(self):
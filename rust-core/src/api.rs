@@ -22,6 +22,13 @@ pub fn start_server(engine: std::sync::Arc<std::sync::Mutex<HomeostaticEngine>>)
         .and(engine.clone())
         .and_then(health_check);
 
+    // POST /influence/batch - Apply several zone influences in one request
+    let batch_route = warp::path!("influence" / "batch")
+        .and(warp::post())
+        .and(warp::body::json())
+        .and(engine.clone())
+        .and_then(apply_influence_batch);
+
     // POST /influence - Apply influence to zone
     let influence_route = warp::path("influence")
         .and(warp::post())
@@ -29,7 +36,8 @@ pub fn start_server(engine: std::sync::Arc<std::sync::Mutex<HomeostaticEngine>>)
         .and(engine.clone())
         .and_then(apply_influence);
 
-    let routes = state_route.or(health_route).or(influence_route);
+    // The batch route must be tried before the /influence prefix match
+    let routes = state_route.or(health_route).or(batch_route).or(influence_route);
 
     warp::serve(routes)
         .run(([127, 0, 0, 1], 3030))
@@ -94,3 +102,38 @@ async fn apply_influence(
 
     Ok(warp::reply::json(&response))
 }
+
+async fn apply_influence_batch(
+    body: Value,
+    engine: std::sync::Arc<std::sync::Mutex<HomeostaticEngine>>,
+) -> Result<impl Reply, Rejection> {
+    let influences: Vec<(usize, f64)> = body["influences"]
+        .as_array()
+        .map(|items| {
+            items
+                .iter()
+                .map(|item| {
+                    (
+                        item["zone_id"].as_u64().unwrap_or(0) as usize,
+                        item["influence"].as_f64().unwrap_or(0.0),
+                    )
+                })
+                .collect()
+        })
+        .unwrap_or_default();
+
+    // One lock for the whole batch
+    {
+        let mut engine = engine.lock().unwrap();
+        for &(zone_id, influence) in &influences {
+            engine.apply_influence(zone_id, influence);
+        }
+    }
+
+    let response = json!({
+        "success": true,
+        "applied": influences.len()
+    });
+
+    Ok(warp::reply::json(&response))
+}
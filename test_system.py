@@ -9,56 +9,80 @@ import random
 import json
 from pathlib import Path
 
+import numpy as np
+
+# State names indexed by the codes BHCS.states holds; STATE_THRESHOLDS are the upper bounds
+STATES = ("CALM", "OVERSTIMULATED", "EMERGENT", "CRITICAL")
+STATE_THRESHOLDS = np.array([0.4, 0.7, 0.9])
+
 class Zone:
-    def __init__(self, zone_id):
+    """View onto one slot of the BHCS zone arrays"""
+    
+    def __init__(self, system, zone_id):
+        self.system = system
         self.id = zone_id
-        self.activity = random.uniform(0.2, 0.8)
-        self.target = 0.5
-        self.state = self.determine_state()
-        self.last_update = time.time()
+    
+    @property
+    def activity(self):
+        return float(self.system.activities[self.id])
+    
+    @property
+    def target(self):
+        return float(self.system.targets[self.id])
+    
+    @property
+    def state(self):
+        return STATES[self.system.states[self.id]]
+    
+    @property
+    def last_update(self):
+        return float(self.system.last_updates[self.id])
     
     def determine_state(self):
-        if self.activity < 0.4:
-            return "CALM"
-        elif self.activity < 0.7:
-            return "OVERSTIMULATED"
-        elif self.activity < 0.9:
-            return "EMERGENT"
-        else:
-            return "CRITICAL"
+        return self.state
     
     def update(self, learning_rate=0.02):
-        error = self.target - self.activity
-        adjustment = learning_rate * error
-        self.activity = max(0.0, min(1.0, self.activity + adjustment))
-        self.state = self.determine_state()
-        self.last_update = time.time()
+        self.system.step(learning_rate, self.id)
     
     def apply_influence(self, influence):
-        self.activity = max(0.0, min(1.0, self.activity + influence))
-        self.state = self.determine_state()
-        self.last_update = time.time()
+        self.system.apply_influence(self.id, influence)
 
 class BHCS:
     def __init__(self, num_zones=5):
-        self.zones = [Zone(i) for i in range(num_zones)]
+        # Zone data lives in parallel arrays so each tick is one vectorized pass
+        self.activities = np.random.uniform(0.2, 0.8, num_zones)
+        self.targets = np.full(num_zones, 0.5)
+        self.states = np.zeros(num_zones, dtype=np.int8)
+        self.last_updates = np.full(num_zones, time.time())
+        self._refresh_states()
+        
+        self.zones = [Zone(self, i) for i in range(num_zones)]
         self.learning_rate = 0.02
         self.running = True
     
+    def _refresh_states(self, index=slice(None)):
+        self.states[index] = np.searchsorted(STATE_THRESHOLDS, self.activities[index], side="right")
+        self.last_updates[index] = time.time()
+    
+    def step(self, learning_rate, index=slice(None)):
+        """Move activity toward target, clamp to [0, 1] and reclassify"""
+        activities = self.activities[index] + learning_rate * (self.targets[index] - self.activities[index])
+        self.activities[index] = np.clip(activities, 0.0, 1.0)
+        self._refresh_states(index)
+    
     def update(self):
-        for zone in self.zones:
-            zone.update(self.learning_rate)
+        self.step(self.learning_rate)
     
     def apply_influence(self, zone_id, influence):
         if 0 <= zone_id < len(self.zones):
-            self.zones[zone_id].apply_influence(influence)
+            self.activities[zone_id] = min(1.0, max(0.0, self.activities[zone_id] + influence))
+            self._refresh_states(zone_id)
     
     def get_system_health(self):
-        calm_zones = sum(1 for zone in self.zones if zone.state == "CALM")
-        return calm_zones / len(self.zones)
+        return int(np.count_nonzero(self.states == 0)) / len(self.zones)
     
     def get_average_activity(self):
-        return sum(zone.activity for zone in self.zones) / len(self.zones)
+        return float(self.activities.mean())
     
     def print_status(self):
         print("\n📊 BHCS System Status:")
@@ -80,8 +104,9 @@ class BHCS:
         print(f"Timestamp: {int(time.time())}")
     
     def reset(self):
-        for i, zone in enumerate(self.zones):
-            self.zones[i] = Zone(i)
+        self.activities[:] = np.random.uniform(0.2, 0.8, len(self.zones))
+        self.targets[:] = 0.5
+        self._refresh_states()
 
 class BioCore:
     def __init__(self):
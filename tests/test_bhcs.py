@@ -0,0 +1,114 @@
+"""
+Test suite for the array-backed BHCS model in test_system.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from test_system import BHCS
+
+
+def legacy_state(activity):
+    """State classification as the per-zone if-chain computed it."""
+    if activity < 0.4:
+        return "CALM"
+    elif activity < 0.7:
+        return "OVERSTIMULATED"
+    elif activity < 0.9:
+        return "EMERGENT"
+    else:
+        return "CRITICAL"
+
+
+class LegacyZone:
+    """The per-zone model BHCS replaced, kept as the reference behaviour."""
+
+    def __init__(self, activity, target=0.5):
+        self.activity = activity
+        self.target = target
+
+    def update(self, learning_rate):
+        error = self.target - self.activity
+        self.activity = max(0.0, min(1.0, self.activity + learning_rate * error))
+
+    def apply_influence(self, influence):
+        self.activity = max(0.0, min(1.0, self.activity + influence))
+
+
+class TestBHCSStates(unittest.TestCase):
+    """Test cases for BHCS state classification."""
+
+    def classify(self, activities):
+        bhcs = BHCS(num_zones=len(activities))
+        bhcs.activities[:] = activities
+        bhcs._refresh_states()
+        return [zone.state for zone in bhcs.zones]
+
+    def test_boundaries_match_if_chain(self):
+        """Test that each threshold belongs to the state above it."""
+        activities = [0.0, 0.3999, 0.4, 0.4001, 0.6999, 0.7, 0.7001,
+                      0.8999, 0.9, 0.9001, 1.0]
+        self.assertEqual(self.classify(activities),
+                         [legacy_state(a) for a in activities])
+
+    def test_random_activities_match_if_chain(self):
+        """Test that searchsorted agrees with the if-chain across [0, 1]."""
+        activities = np.random.default_rng(0).uniform(0.0, 1.0, 500)
+        self.assertEqual(self.classify(activities),
+                         [legacy_state(a) for a in activities])
+
+    def test_zone_attributes_are_read_only(self):
+        """Test that zones are views and must be changed through BHCS."""
+        bhcs = BHCS(num_zones=2)
+        with self.assertRaises(AttributeError):
+            bhcs.zones[0].activity = 0.5
+        bhcs.apply_influence(0, 1.0)
+        self.assertEqual(bhcs.zones[0].activity, 1.0)
+        self.assertEqual(bhcs.zones[0].state, "CRITICAL")
+
+
+class TestBHCSStep(unittest.TestCase):
+    """Test cases for the vectorized BHCS update against per-zone updates."""
+
+    def setUp(self):
+        self.bhcs = BHCS(num_zones=5)
+        self.bhcs.activities[:] = [0.05, 0.39, 0.7, 0.95, 1.0]
+        self.bhcs._refresh_states()
+        self.legacy = [LegacyZone(a) for a in self.bhcs.activities.tolist()]
+
+    def assertMatchesLegacy(self):
+        self.assertEqual([zone.activity for zone in self.bhcs.zones],
+                         [zone.activity for zone in self.legacy])
+        self.assertEqual([zone.state for zone in self.bhcs.zones],
+                         [legacy_state(zone.activity) for zone in self.legacy])
+
+    def test_update_matches_per_zone_updates(self):
+        """Test that repeated system updates track the per-zone model exactly."""
+        for _ in range(50):
+            self.bhcs.update()
+            for zone in self.legacy:
+                zone.update(self.bhcs.learning_rate)
+        self.assertMatchesLegacy()
+
+    def test_single_zone_update(self):
+        """Test that Zone.update only moves its own slot."""
+        self.bhcs.zones[3].update(0.5)
+        self.legacy[3].update(0.5)
+        self.assertMatchesLegacy()
+
+    def test_influences_clamp_like_per_zone_model(self):
+        """Test that influences clamp to [0, 1] and reclassify the zone."""
+        for zone_id, influence in [(0, -0.5), (1, 0.01), (2, 0.6), (4, -0.15), (9, 1.0)]:
+            self.bhcs.apply_influence(zone_id, influence)
+            if zone_id < len(self.legacy):
+                self.legacy[zone_id].apply_influence(influence)
+        self.assertMatchesLegacy()
+
+
+if __name__ == "__main__":
+    unittest.main()
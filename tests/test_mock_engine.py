@@ -0,0 +1,71 @@
+"""
+Test suite for the Python mock of the Rust homeostatic engine.
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_mock_engine import MockRustEngine
+
+
+class TestApplyInfluences(unittest.TestCase):
+    """Test cases for batched influences on the mock engine."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Stop the background regulation so activities only change under test
+        cls.engine = MockRustEngine()
+        cls.engine.running = False
+        cls.engine.update_thread.join()
+
+    def setUp(self):
+        self.engine.activity[:] = [0.5, 0.5, 0.2, 0.8, 0.4]
+
+    def test_influences_apply_in_order_with_clamping(self):
+        """Test that each influence is clamped before the next, as in Rust."""
+        result = self.engine.apply_influences([
+            {"zone_id": 1, "influence": 0.8},
+            {"zone_id": 1, "influence": -0.5},
+        ])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["applied"], 2)
+        self.assertEqual(self.engine.activity[1], 0.5)
+
+    def test_matches_single_influences(self):
+        """Test that a batch lands where the same single calls would."""
+        batch = [{"zone_id": 0, "influence": -0.7}, {"zone_id": 3, "influence": 0.1},
+                 {"zone_id": 0, "influence": 0.25}]
+        self.engine.apply_influences(batch)
+        batched = self.engine.activity.tolist()
+
+        self.setUp()
+        for item in batch:
+            self.engine.apply_influence(item)
+        self.assertEqual(batched, self.engine.activity.tolist())
+
+    def test_unknown_zone_rejects_whole_batch(self):
+        """Test that an invalid zone id fails without applying anything."""
+        before = self.engine.activity.tolist()
+        result = self.engine.apply_influences([
+            {"zone_id": 0, "influence": 0.3},
+            {"zone_id": 7, "influence": 0.3},
+        ])
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "Zone 7 not found")
+        self.assertEqual(self.engine.activity.tolist(), before)
+
+    def test_state_serializes_without_float32_artefacts(self):
+        """Test that reported activities keep the values that were set."""
+        self.engine.activity[:] = [0.3, 0.6, 0.2, 0.8, 0.4]
+        payload = json.dumps(self.engine.get_state())
+        self.assertIn('"activity": 0.3,', payload)
+        self.assertEqual([zone["state"] for zone in json.loads(payload)["zones"]],
+                         ["CALM", "OVERSTIMULATED", "CALM", "EMERGENT", "OVERSTIMULATED"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+Test suite for the LunaBeyond web server helpers.
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lunabeyond-ai" / "src"))
+
+import web_luna
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the chat reply cache."""
+
+    def setUp(self):
+        self.luna = web_luna.get_luna()
+        self.calls = []
+        process_conversation = self.luna.process_conversation
+
+        async def counting(message):
+            self.calls.append(message)
+            return await process_conversation(message)
+
+        self.luna.process_conversation = counting
+        web_luna._RESPONSE_CACHE.clear()
+
+    def tearDown(self):
+        del self.luna.process_conversation
+        web_luna._RESPONSE_CACHE.clear()
+
+    def converse(self, message):
+        return asyncio.run(web_luna._converse(self.luna, message))
+
+    def test_message_key_ignores_order_case_and_repeats(self):
+        """Test that rewordings with the same words share one key."""
+        key = web_luna._message_key
+        self.assertEqual(key("zone status"), key("status   zone"))
+        self.assertEqual(key("status status zone"), key("zone status"))
+        self.assertNotEqual(key("zone status"), key("zone status?"))
+        self.assertNotEqual(key("zones"), key("zone"))
+
+    def test_reworded_question_is_served_from_cache(self):
+        """Test that a reworded repeat does not reach the model."""
+        first = self.converse("Hello there")
+        second = self.converse("  there HELLO ")
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_entries_expire_after_ttl(self):
+        """Test that an entry older than the TTL is recomputed."""
+        self.converse("hello there")
+        key, (stamp, reply) = next(iter(web_luna._RESPONSE_CACHE.items()))
+        web_luna._RESPONSE_CACHE[key] = (stamp - web_luna._RESPONSE_CACHE_TTL - 1, reply)
+        self.converse("hello there")
+        self.assertEqual(len(self.calls), 2)
+
+    def test_ai_status_reply_tracks_conversation_count(self):
+        """Test that the AI status reply is not reused once its counts change."""
+        self.converse("tell me about your intelligence")
+        self.luna.conversation_count += 1
+        reply = self.converse("tell me about your intelligence")
+        self.assertEqual(len(self.calls), 2)
+        self.assertIn(f"Conversations: {self.luna.conversation_count}", reply)
+
+    def test_actions_are_never_cached(self):
+        """Test that /learn, /evolve and optimization requests always run."""
+        for message in ("/learn", "/evolve", "optimize the city"):
+            self.converse(message)
+            self.converse(message)
+        self.assertEqual(len(self.calls), 6)
+
+    def test_zone_change_invalidates_reply(self):
+        """Test that a reply is recomputed once a zone changes state."""
+        self.converse("hello there")
+        zone = self.luna.bhcs.zones[0]
+        self.luna.bhcs.apply_influence(0, -1.0 if zone.activity >= 0.4 else 1.0)
+        self.converse("hello there")
+        self.assertEqual(len(self.calls), 2)
+
+
+class TestEtagMatches(unittest.TestCase):
+    """Test cases for If-None-Match comparison."""
+
+    ETAG = '"abc123"'
+
+    def test_exact_match(self):
+        """Test that the same strong tag matches."""
+        self.assertTrue(web_luna._etag_matches('"abc123"', self.ETAG))
+
+    def test_weak_tag_matches(self):
+        """Test that a W/ prefix added by a proxy still matches."""
+        self.assertTrue(web_luna._etag_matches('W/"abc123"', self.ETAG))
+
+    def test_list_of_tags(self):
+        """Test that a match anywhere in a comma-separated list counts."""
+        self.assertTrue(web_luna._etag_matches('"old", W/"abc123" ,"other"', self.ETAG))
+        self.assertFalse(web_luna._etag_matches('"old", "other"', self.ETAG))
+
+    def test_wildcard(self):
+        """Test that '*' matches any current representation."""
+        self.assertTrue(web_luna._etag_matches('*', self.ETAG))
+        self.assertTrue(web_luna._etag_matches('"old", *', self.ETAG))
+
+    def test_missing_or_different(self):
+        """Test that absent, empty and unrelated headers do not match."""
+        self.assertFalse(web_luna._etag_matches(None, self.ETAG))
+        self.assertFalse(web_luna._etag_matches('', self.ETAG))
+        self.assertFalse(web_luna._etag_matches('"abc1234"', self.ETAG))
+        self.assertFalse(web_luna._etag_matches('abc123', self.ETAG))
+
+
+class TestSelectDashboard(unittest.TestCase):
+    """Test cases for dashboard encoding negotiation."""
+
+    def encoding(self, accept_encoding):
+        return web_luna._select_dashboard(accept_encoding)[0]
+
+    def test_gzip_accepted(self):
+        """Test that gzip is chosen when listed, in any case or with a q-value."""
+        self.assertEqual(self.encoding('gzip'), 'gzip')
+        self.assertEqual(self.encoding('GZIP, deflate'), 'gzip')
+        self.assertEqual(self.encoding('deflate, gzip;q=0.5'), 'gzip')
+
+    def test_zero_q_value_refuses(self):
+        """Test that q=0 in any spelling rules an encoding out."""
+        for header in ('gzip;q=0', 'gzip; q=0.0', 'gzip;q=0.000', 'br;q=0, gzip;q=0'):
+            self.assertIsNone(self.encoding(header), header)
+
+    def test_refused_brotli_falls_back_to_gzip(self):
+        """Test that refusing br still serves gzip when that is accepted."""
+        self.assertEqual(self.encoding('br;q=0, gzip'), 'gzip')
+
+    def test_identity_when_nothing_matches(self):
+        """Test that unknown or missing encodings get the uncompressed page."""
+        self.assertIsNone(self.encoding(''))
+        self.assertIsNone(self.encoding('identity'))
+        self.assertEqual(web_luna._select_dashboard('')[1], web_luna._DASHBOARD_HTML)
+
+    @unittest.skipUnless(web_luna.BROTLI_AVAILABLE, "brotli not installed")
+    def test_brotli_preferred(self):
+        """Test that br wins over gzip when both are accepted."""
+        self.assertEqual(self.encoding('gzip, br'), 'br')
+
+
+class QuietHandler(web_luna.LunaWebInterface):
+    """Request handler without per-request access logging."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LegacyServerTestCase(unittest.TestCase):
+    """Base class running the stdlib server on an ephemeral port."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = web_luna._LunaHTTPServer(('127.0.0.1', 0), QuietHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def status(self, headers, body=b'', path='/api/command'):
+        """Status code for a raw POST with the given header lines."""
+        request = f'POST {path} HTTP/1.1\r\nHost: test\r\n'.encode()
+        request += b''.join(line.encode() + b'\r\n' for line in headers) + b'\r\n' + body
+        with socket.create_connection(self.server.server_address, timeout=5) as sock:
+            sock.sendall(request)
+            return int(sock.makefile('rb').readline().split()[1])
+
+
+class TestReadBody(LegacyServerTestCase):
+    """Test cases for POST body validation on the stdlib server."""
+
+    def test_missing_length_is_411(self):
+        """Test that a body without Content-Length is refused."""
+        self.assertEqual(self.status([]), 411)
+
+    def test_chunked_is_411(self):
+        """Test that chunked bodies are refused rather than left unread."""
+        self.assertEqual(self.status(['Transfer-Encoding: chunked'], b'0\r\n\r\n'), 411)
+
+    def test_bad_length_is_400(self):
+        """Test that empty or malformed lengths are rejected."""
+        self.assertEqual(self.status(['Content-Length: 0']), 400)
+        self.assertEqual(self.status(['Content-Length: abc']), 400)
+        self.assertEqual(self.status(['Content-Length: -5']), 400)
+
+    def test_oversized_body_is_413(self):
+        """Test that a declared length past MAX_BODY is refused before reading."""
+        self.assertEqual(self.status([f'Content-Length: {web_luna.MAX_BODY + 1}']), 413)
+
+    def test_valid_body_is_accepted(self):
+        """Test that a sized JSON body reaches the handler."""
+        body = b'{"command": "/help"}'
+        self.assertEqual(self.status(['Content-Type: application/json',
+                                      f'Content-Length: {len(body)}'], body), 200)
+
+
+class TestCannedReplies(LegacyServerTestCase):
+    """Test cases for the precomputed /help reply."""
+
+    def post(self, path, body):
+        return self.status(['Content-Type: application/json',
+                            f'Content-Length: {len(body)}'], body, path)
+
+    def test_chat_help_is_recorded(self):
+        """Test that /help sent as chat still counts as a conversation turn."""
+        luna = web_luna.get_luna()
+        count = luna.conversation_count
+        self.assertEqual(self.post('/api/chat', b'{"message": "/help"}'), 200)
+        self.assertEqual(luna.conversation_count, count + 1)
+        self.assertEqual(luna.conversation_history[-1]['ai_response'], web_luna.HELP_MESSAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()